@@ -1,18 +1,54 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable
 from application.interfaces import GameInsightAnalyzerInterface
+from application.pipeline import Stage, StagePipeline
 from core.models import (
     GameData,
     LaneMatchupReport,
     JungleMatchupReport,
     ThreatProjectionReport,
     CooldownsComparisonReport,
+    FullMatchReport,
     LaningDimension,
     JungleDimension,
 )
 
 
 class GameInsightAnalyzer(GameInsightAnalyzerInterface):
-    def __init__(self, llm):
+    def __init__(self, llm, max_concurrency: int = 8):
         self.llm = llm
+        self.max_concurrency = max_concurrency
+        # Shared by every analysis, so max_concurrency bounds the in-flight LLM calls of a whole report
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm") if max_concurrency > 1 else None
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the shared LLM call pool; wait lets calls already running finish."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "GameInsightAnalyzer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _fan_out(self, calls: dict[Hashable, Callable]) -> tuple[dict, dict[Hashable, Exception]]:
+        """
+        Run independent LLM calls concurrently. Results come back in the order of calls;
+        a failing call is reported in the second dict instead of failing its siblings.
+        """
+        if self._pool is None:
+            futures = None
+        else:
+            futures = {key: self._pool.submit(call) for key, call in calls.items()}
+        results, errors = {}, {}
+        for key, call in calls.items():
+            try:
+                results[key] = futures[key].result() if futures is not None else call()
+            except Exception as e:
+                errors[key] = e
+        return results, errors
 
     def start_insight_session(self) -> None:
         self.llm.start_context_window()
@@ -20,39 +56,94 @@ class GameInsightAnalyzer(GameInsightAnalyzerInterface):
     def end_insight_session(self) -> None:
         self.llm.end_context_window()
 
+    def _batches(self, batch: str) -> bool:
+        """
+        Whether to ask for items through the batched method. Interface implementations say
+        so via batches(); for duck-typed analyzers having the method is enough.
+        """
+        batches = getattr(self.llm, "batches", None)
+        if batches is not None:
+            return batches(batch)
+        return hasattr(self.llm, batch)
+
+    def _single_calls(self, game_data: GameData, name: str, items: list, single: str) -> dict[Hashable, Callable]:
+        fetch = getattr(self.llm, single)
+        return {(name, item): (lambda item=item: fetch(game_data, item)) for item in items}
+
+    def _item_calls(self, game_data: GameData, name: str, items: list, single: str, batch: str) -> dict[Hashable, Callable]:
+        """One call for all items when the LLM analyzer batches them, otherwise one concurrent call per item."""
+        if self._batches(batch):
+            batched = getattr(self.llm, batch)
+            return {name: lambda: batched(game_data, items)}
+        return self._single_calls(game_data, name, items, single)
+
+    def _fill_batches(self, game_data: GameData, results: dict, errors: dict, batches: list[tuple[str, list, str]]) -> None:
+        """
+        Spread batched results into per-item keys and fan out per-item calls for whatever a
+        batch left out (every item, if the batch failed), so a bad batched answer costs one
+        extra concurrent round rather than a serial one.
+        """
+        retry = {}
+        for name, items, single in batches:
+            if name not in results and name not in errors:
+                continue
+            found = results.pop(name, {})
+            errors.pop(name, None)
+            results.update({(name, item): found[item] for item in items if item in found})
+            retry.update(self._single_calls(game_data, name, [item for item in items if item not in found], single))
+        retried, failed = self._fan_out(retry)
+        results.update(retried)
+        errors.update(failed)
+
+    def _item_results(self, name: str, items: list, results: dict, errors: dict, label: Callable = str) -> tuple[dict, list[str]]:
+        """Per-item results and failure notes, in item order."""
+        found = {item: results[(name, item)] for item in items if (name, item) in results}
+        return found, [f"{label(item)} analysis failed: {errors[(name, item)]}" for item in items if (name, item) in errors]
+
     def analyze_lane_matchup(self, game_data: GameData) -> LaneMatchupReport:
-        level_keys = [1, 2, 3, 4, 5, 6]
-        level_data = {
-            f"level_{i}": self.llm.get_lane_power_level(game_data, i)
-            for i in level_keys
-        }
-
-        extra_spikes = self.llm.get_lane_extra_spikes(game_data)
-        style_analysis = {
-            dim: self.llm.get_lane_style_entry(game_data, dim)
-            for dim in LaningDimension.__args__
-        }
+        levels = list(range(1, 7))
+        dims = list(LaningDimension.__args__)
+        calls = self._item_calls(game_data, "levels", levels, "get_lane_power_level", "get_lane_power_levels")
+        calls["extra_spikes"] = lambda: self.llm.get_lane_extra_spikes(game_data)
+        calls.update(self._item_calls(game_data, "styles", dims, "get_lane_style_entry", "get_lane_style_entries"))
+        results, errors = self._fan_out(calls)
+        self._fill_batches(game_data, results, errors, [
+            ("levels", levels, "get_lane_power_level"),
+            ("styles", dims, "get_lane_style_entry"),
+        ])
+
+        level_results, comments = self._item_results("levels", levels, results, errors, label=lambda i: f"level_{i}")
+        if "extra_spikes" in errors:
+            comments.append(f"extra_spikes analysis failed: {errors['extra_spikes']}")
+        style_analysis, style_comments = self._item_results("styles", dims, results, errors)
 
         return LaneMatchupReport(
-            **level_data,
-            extra_spikes=extra_spikes,
+            **{f"level_{i}": level_results.get(i, ("Even", "Analysis unavailable.")) for i in levels},
+            extra_spikes=results.get("extra_spikes", {}),
             analysis=style_analysis,
-            extra_comments=[]
+            extra_comments=comments + style_comments
         )
 
     def analyze_jungle_matchup(self, game_data: GameData) -> JungleMatchupReport:
-        analysis = {
-            dim: self.llm.get_jungle_dimension_entry(game_data, dim)
-            for dim in JungleDimension.__args__
-        }
-        return JungleMatchupReport(analysis=analysis, extra_comments=[])
+        dims = list(JungleDimension.__args__)
+        results, errors = self._fan_out(self._item_calls(
+            game_data, "jungle", dims, "get_jungle_dimension_entry", "get_jungle_dimension_entries"))
+        self._fill_batches(game_data, results, errors, [("jungle", dims, "get_jungle_dimension_entry")])
+        analysis, comments = self._item_results("jungle", dims, results, errors)
+        return JungleMatchupReport(analysis=analysis, extra_comments=comments)
 
     def analyze_threats(self, game_data: GameData) -> ThreatProjectionReport:
-        sidelane_threats = self.llm.get_sidelane_threats(game_data)
-        teamfight_threats = self.llm.get_teamfight_threats(game_data)
+        results, errors = self._fan_out({
+            "sidelane": lambda: self.llm.get_sidelane_threats(game_data),
+            "teamfight": lambda: self.llm.get_teamfight_threats(game_data),
+        })
+        if not results:
+            # Nothing to show at all: fail the section like any other stage
+            raise errors["sidelane"]
         return ThreatProjectionReport(
-            sidelane_threats=sidelane_threats,
-            teamfight_threats=teamfight_threats
+            sidelane_threats=results.get("sidelane", {}),
+            teamfight_threats=results.get("teamfight", {}),
+            errors={side: f"{type(e).__name__}: {e}" for side, e in errors.items()},
         )
 
     def analyze_cooldowns(self, game_data: GameData) -> CooldownsComparisonReport:
@@ -70,3 +161,28 @@ class GameInsightAnalyzer(GameInsightAnalyzerInterface):
             enemyR={opponent.summoner_name: opponent.champion.r_cooldowns},
             cooldown_leverage_comment=self.llm.get_cooldowns_leverage_suggestion(game_data)
         )
+
+    def generate_full_report(self, game_data: GameData) -> FullMatchReport:
+        """
+        Run the four sections as independent pipeline stages; their LLM calls share the
+        analyzer's pool. A failed section is left out of the report and listed in errors.
+        """
+        started = time.perf_counter()
+        pipeline = StagePipeline([
+            Stage("lane", lambda _: self.analyze_lane_matchup(game_data)),
+            Stage("jungle", lambda _: self.analyze_jungle_matchup(game_data)),
+            Stage("threats", lambda _: self.analyze_threats(game_data)),
+            Stage("cooldowns", lambda _: self.analyze_cooldowns(game_data)),
+        ])
+        outcome = pipeline.run()
+        outcome.timings["total"] = time.perf_counter() - started
+        threats = outcome.results.get("threats")
+        if threats is not None:
+            # A section that came back partly empty still has to show up as a failure
+            outcome.errors.update({f"threats.{side}": error for side, error in threats.errors.items()})
+        return FullMatchReport(
+            summoner_name=game_data.summoner_name,
+            **outcome.results,
+            stage_timings=outcome.timings,
+            errors=outcome.errors,
+        )
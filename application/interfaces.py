@@ -5,6 +5,7 @@ from core.models import (
     JungleMatchupReport,
     ThreatProjectionReport,
     CooldownsComparisonReport,
+    FullMatchReport,
 )
 
 class GameInsightAnalyzerInterface(ABC):
@@ -31,3 +32,7 @@ class GameInsightAnalyzerInterface(ABC):
     @abstractmethod
     def analyze_cooldowns(self, game_data: GameData) -> CooldownsComparisonReport:
         pass
+
+    @abstractmethod
+    def generate_full_report(self, game_data: GameData) -> FullMatchReport:
+        pass
@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Iterable
+
+class Stage:
+    """A named unit of work; run receives a dict with the results of its dependencies."""
+
+    def __init__(self, name: str, run: Callable[[dict], Any], deps: Iterable[str] = ()):
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+
+class PipelineResult:
+    def __init__(self):
+        self.results: dict[str, Any] = {}
+        self.timings: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+
+class StagePipeline:
+    """
+    Runs a dependency graph of stages on a thread pool. Each stage starts as soon as all
+    of its dependencies have finished, so independent stages overlap and the total time
+    follows the slowest path rather than the sum. A failing stage only takes down the
+    stages that depend on it; everything else still produces a result.
+    """
+
+    def __init__(self, stages: Iterable[Stage], max_workers: int = 4):
+        self.stages = {stage.name: stage for stage in stages}
+        self.max_workers = max_workers
+        self._check_graph()
+
+    def _check_graph(self) -> None:
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.deps if dep not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages {unknown}")
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def _timed(self, stage: Stage, inputs: dict) -> tuple[Any, str | None, float]:
+        started = time.perf_counter()
+        try:
+            value, error = stage.run(inputs), None
+        except Exception as e:
+            value, error = None, f"{type(e).__name__}: {e}"
+        return value, error, time.perf_counter() - started
+
+    def run(self) -> PipelineResult:
+        result = PipelineResult()
+        pending = dict(self.stages)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as pool:
+            while True:
+                # A skip can make further dependents skippable, so sweep until nothing changes
+                changed = True
+                while changed:
+                    changed = False
+                    for name, stage in list(pending.items()):
+                        failed = [dep for dep in stage.deps if dep in result.errors]
+                        if failed:
+                            result.errors[name] = f"skipped: {', '.join(failed)} failed"
+                        elif all(dep in result.results for dep in stage.deps):
+                            inputs = {dep: result.results[dep] for dep in stage.deps}
+                            running[pool.submit(self._timed, stage, inputs)] = name
+                        else:
+                            continue
+                        del pending[name]
+                        changed = True
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    value, error, result.timings[name] = future.result()
+                    if error is None:
+                        result.results[name] = value
+                    else:
+                        result.errors[name] = error
+        return result
@@ -1,6 +1,7 @@
 from .literals import PlayerRole, TeamSide, Comparison, Strength, LaningDimension, JungleDimension
 from .champion_data import ChampionData
-from .runes import RuneEntry, Runes
+from .champion_table import ChampionTable
+from .runes import RuneEntry, Runes, RuneIndex
 from .summoner_spells import SummonerSpell
 from .game_data import PlayerGameEntry, GameData
 from .matchup import LaneMatchupReport, JungleMatchupReport
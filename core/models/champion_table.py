@@ -0,0 +1,87 @@
+import threading
+from array import array
+from core.models.champion_data import ChampionData
+
+STAT_FIELDS = (
+    "base_hp", "base_hp_regen", "base_mp", "base_mp_regen", "base_armor", "base_mr", "base_ad", "base_as",
+    "base_movespeed", "base_range", "hp_per_level", "mp_per_level", "armor_per_level", "mr_per_level",
+    "ad_per_level", "as_per_level",
+)
+COOLDOWN_FIELDS = ("q_cooldowns", "w_cooldowns", "e_cooldowns", "r_cooldowns")
+
+class ChampionTable:
+    """
+    Append-only, interned champion storage for one patch. Each distinct champion is stored
+    once as a row of doubles (stats) plus a slice of a shared cooldown array, and players
+    refer to it by row ID; ChampionData objects are only built when someone asks for one.
+    """
+
+    _tables: dict[str, "ChampionTable"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, patch: str = ""):
+        self.patch = patch
+        self._names: list[str] = []
+        self._stats = array("d")
+        self._cooldowns = array("d")
+        # Row i's Q/W/E/R cooldowns are _cooldowns[_cd_offsets[5i + k]:_cd_offsets[5i + k + 1]]
+        self._cd_offsets = array("I")
+        self._ids: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_patch(cls, patch: str) -> "ChampionTable":
+        table = cls._tables.get(patch)
+        if table is None:
+            with cls._registry_lock:
+                table = cls._tables.setdefault(patch, cls(patch))
+        return table
+
+    @classmethod
+    def release(cls, patch: str) -> None:
+        """Forget a patch's table; entries that still reference it keep it alive."""
+        with cls._registry_lock:
+            cls._tables.pop(patch, None)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, champion: ChampionData) -> int:
+        stats = tuple(float(getattr(champion, field)) for field in STAT_FIELDS)
+        cooldowns = tuple(tuple(float(cd) for cd in getattr(champion, field)) for field in COOLDOWN_FIELDS)
+        key = (champion.name, stats, cooldowns)
+        champion_id = self._ids.get(key)
+        if champion_id is not None:
+            return champion_id
+        with self._lock:
+            champion_id = self._ids.get(key)
+            if champion_id is not None:
+                return champion_id
+            champion_id = len(self._names)
+            self._stats.extend(stats)
+            for ability in cooldowns:
+                self._cd_offsets.append(len(self._cooldowns))
+                self._cooldowns.extend(ability)
+            self._cd_offsets.append(len(self._cooldowns))
+            self._names.append(champion.name)
+            self._ids[key] = champion_id
+            return champion_id
+
+    def stat_values(self) -> tuple[list[str], array]:
+        """Snapshot of all names and the flat stats array (row-major, STAT_FIELDS per row)."""
+        with self._lock:
+            return list(self._names), array("d", self._stats)
+
+    def name(self, champion_id: int) -> str:
+        return self._names[champion_id]
+
+    def view(self, champion_id: int) -> ChampionData:
+        """Materialise a ChampionData for a row; the values were validated when interned."""
+        width = len(STAT_FIELDS)
+        stats = self._stats[champion_id * width:(champion_id + 1) * width]
+        offsets = self._cd_offsets[champion_id * 5:champion_id * 5 + 5]
+        cooldowns = {
+            field: self._cooldowns[offsets[k]:offsets[k + 1]].tolist()
+            for k, field in enumerate(COOLDOWN_FIELDS)
+        }
+        return ChampionData.model_construct(name=self._names[champion_id], **dict(zip(STAT_FIELDS, stats)), **cooldowns)
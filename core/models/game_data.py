@@ -1,32 +1,91 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, PrivateAttr, model_serializer, model_validator
+from typing import Any, Dict, List, Tuple
 from core.models.champion_data import ChampionData
+from core.models.champion_table import ChampionTable
 from core.models.runes import Runes
 from core.models.literals import PlayerRole, TeamSide
 
 class PlayerGameEntry(BaseModel):
     summoner_name: str
-    champion: ChampionData
+    # Row in the patch's shared ChampionTable; construct with champion=ChampionData(...) as before
+    champion_id: int
+    patch: str = ""
     runes: Runes
     summoner_spells: List[str]
     role: PlayerRole
     team: TeamSide
+    _table: ChampionTable = PrivateAttr()
+
+    @model_validator(mode="before")
+    @classmethod
+    def _intern_champion(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "champion" in data:
+            data = dict(data)
+            champion = data.pop("champion")
+            if not isinstance(champion, ChampionData):
+                champion = ChampionData.model_validate(champion)
+            data["champion_id"] = ChampionTable.for_patch(data.get("patch", "")).intern(champion)
+        return data
+
+    def model_post_init(self, __context: Any) -> None:
+        self._table = ChampionTable.for_patch(self.patch)
+
+    @property
+    def champion(self) -> ChampionData:
+        return self._table.view(self.champion_id)
+
+    @property
+    def champion_table(self) -> ChampionTable:
+        """The table champion_id indexes into; stays valid after ChampionTable.release."""
+        return self._table
+
+    @model_serializer(mode="wrap")
+    def _serialize_champion(self, handler):
+        # Row IDs are process-local, so serialized entries carry the champion itself
+        data = handler(self)
+        data.pop("champion_id", None)
+        data["champion"] = self.champion.model_dump()
+        return data
 
 class GameData(BaseModel):
     game_id: str
     summoner_name: str
     players: List[PlayerGameEntry]
     user_role: PlayerRole
+    # Data Dragon version the game was mapped with; part of cached LLM analysis keys
+    patch_version: str = ""
+    # Lookups built once from players (first match wins, as with a scan); rebuild with
+    # _build_index() after mutating players in place
+    _by_name: Dict[str, PlayerGameEntry] = PrivateAttr(default_factory=dict)
+    _by_slot: Dict[Tuple[str, str], PlayerGameEntry] = PrivateAttr(default_factory=dict)
+    _by_team: Dict[str, List[PlayerGameEntry]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._build_index()
+
+    def _build_index(self) -> None:
+        self._by_name, self._by_slot, self._by_team = {}, {}, {}
+        for p in self.players:
+            self._by_name.setdefault(p.summoner_name, p)
+            self._by_slot.setdefault((p.role, p.team), p)
+            self._by_team.setdefault(p.team, []).append(p)
+
+    @staticmethod
+    def _lookup(index: dict, key) -> PlayerGameEntry:
+        entry = index.get(key)
+        if entry is None:
+            raise StopIteration(key)
+        return entry
 
     def get_user_entry(self) -> PlayerGameEntry:
-        return next(p for p in self.players if p.summoner_name == self.summoner_name)
+        return self._lookup(self._by_name, self.summoner_name)
 
     def get_lane_opponent_entry(self) -> PlayerGameEntry:
         user = self.get_user_entry()
-        return next(p for p in self.players if p.role == user.role and p.team != user.team)
+        return self._lookup(self._by_slot, (user.role, "ENEMY" if user.team == "ALLY" else "ALLY"))
 
     def get_player(self, role: PlayerRole, team: TeamSide) -> PlayerGameEntry:
-        return next(p for p in self.players if p.role == role and p.team == team)
+        return self._lookup(self._by_slot, (role, team))
 
     def get_team(self, side: TeamSide) -> List[PlayerGameEntry]:
-        return [p for p in self.players if p.team == side]
\ No newline at end of file
+        return list(self._by_team.get(side, []))
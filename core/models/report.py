@@ -1,11 +1,15 @@
 from pydantic import BaseModel
+from typing import Dict, Optional
 from core.models.matchup import LaneMatchupReport, JungleMatchupReport
 from core.models.cooldowns import CooldownsComparisonReport
 from core.models.threats import ThreatProjectionReport
 
 class FullMatchReport(BaseModel):
     summoner_name: str
-    lane: LaneMatchupReport
-    jungle: JungleMatchupReport
-    cooldowns: CooldownsComparisonReport
-    threats: ThreatProjectionReport
+    # A section is None when its stage failed; the reason is in errors
+    lane: Optional[LaneMatchupReport] = None
+    jungle: Optional[JungleMatchupReport] = None
+    cooldowns: Optional[CooldownsComparisonReport] = None
+    threats: Optional[ThreatProjectionReport] = None
+    stage_timings: Dict[str, float] = {}
+    errors: Dict[str, str] = {}
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List
 
 class RuneEntry(BaseModel):
     name: str
@@ -9,4 +9,10 @@ class Runes(BaseModel):
     keystone: RuneEntry
     primary: List[RuneEntry]
     secondary: List[RuneEntry]
-    shards: List[RuneEntry]
\ No newline at end of file
+    shards: List[RuneEntry]
+
+class RuneIndex(BaseModel):
+    perks: Dict[int, RuneEntry]
+    styles: Dict[int, str]
+    perk_style: Dict[int, int]
+    shard_ids: List[int]
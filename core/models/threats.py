@@ -4,3 +4,5 @@ from typing import Dict
 class ThreatProjectionReport(BaseModel):
     sidelane_threats: Dict[str, str]
     teamfight_threats: Dict[str, str]
+    # Side ("sidelane"/"teamfight") -> why its threats are missing; the other side is still filled
+    errors: Dict[str, str] = {}
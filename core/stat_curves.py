@@ -0,0 +1,106 @@
+"""
+Champion stats at levels 1-18, computed for a whole patch at once with NumPy.
+
+curves_for_static covers every champion of the patch a static data provider serves, looked
+up by name; curves_for_table covers the champions interned in a ChampionTable, with rows
+matching its champion IDs, which is what player entries carry.
+
+Riot's per-level growth is not linear: a stat gains growth * (n - 1) * (0.7025 + 0.0175 * (n - 1))
+at level n, and bonus attack speed follows the same curve as a percentage of base.
+"""
+import threading
+import weakref
+from typing import Iterable
+import numpy as np
+from core.models import ChampionData, ChampionTable
+from core.models.champion_table import STAT_FIELDS
+
+LEVELS = np.arange(1, 19)
+GROWTH = (LEVELS - 1) * (0.7025 + 0.0175 * (LEVELS - 1))
+CURVE_STATS = ("hp", "ad", "armor", "mr", "attack_speed")
+
+# (base, per-level) columns in ChampionTable rows for the additive stats
+_ADDITIVE = [
+    (STAT_FIELDS.index(base), STAT_FIELDS.index(growth))
+    for base, growth in (("base_hp", "hp_per_level"), ("base_ad", "ad_per_level"),
+                         ("base_armor", "armor_per_level"), ("base_mr", "mr_per_level"))
+]
+_BASE_AS = STAT_FIELDS.index("base_as")
+_AS_PER_LEVEL = STAT_FIELDS.index("as_per_level")
+
+class StatCurves:
+    """values[champion, level - 1, stat] for a set of champions, in CURVE_STATS order."""
+
+    def __init__(self, names: list[str], rows: np.ndarray):
+        self.names = names
+        self._rows = {name: i for i, name in reversed(list(enumerate(names)))}
+        rows = rows.reshape(len(names), len(STAT_FIELDS))
+        values = np.empty((len(names), len(LEVELS), len(CURVE_STATS)))
+        for k, (base, growth) in enumerate(_ADDITIVE):
+            values[:, :, k] = rows[:, base, None] + rows[:, growth, None] * GROWTH
+        values[:, :, 4] = rows[:, _BASE_AS, None] * (1 + rows[:, _AS_PER_LEVEL, None] / 100 * GROWTH)
+        self.values = values
+
+    @classmethod
+    def from_table(cls, table: ChampionTable) -> "StatCurves":
+        names, stats = table.stat_values()
+        return cls(names, np.frombuffer(stats, dtype=np.float64))
+
+    @classmethod
+    def from_champions(cls, champions: Iterable[ChampionData]) -> "StatCurves":
+        champions = list(champions)
+        rows = np.array([[getattr(c, field) for field in STAT_FIELDS] for c in champions], dtype=np.float64)
+        return cls([c.name for c in champions], rows)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, name: str) -> int:
+        return self._rows[name]
+
+    def at(self, champion: int, level: int) -> dict[str, float]:
+        return dict(zip(CURVE_STATS, self.values[champion, level - 1].tolist()))
+
+    def compare(self, champion: int, opponent: int) -> np.ndarray:
+        """Per-level stat ratios champion / opponent, shape (18, len(CURVE_STATS)); > 1 means ahead."""
+        return self.values[champion] / self.values[opponent]
+
+# Keyed by the table object, not its patch: after ChampionTable.release a patch gets a new
+# table whose row IDs start over, and the old table's curves go once nothing references it
+_cache: "weakref.WeakKeyDictionary[ChampionTable, StatCurves]" = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+def curves_for_table(table: ChampionTable) -> StatCurves:
+    """
+    Curves for every champion interned in the table; rows match its champion IDs.
+    Rebuilt only when the table has grown since the last call.
+    """
+    curves = _cache.get(table)
+    if curves is None or len(curves) < len(table):
+        with _cache_lock:
+            curves = _cache.get(table)
+            if curves is None or len(curves) < len(table):
+                curves = _cache[table] = StatCurves.from_table(table)
+    return curves
+
+# Only the patch currently served is kept; a refresh replaces it
+_patch_curves: tuple[str, StatCurves] | None = None
+
+def curves_for_static(static) -> StatCurves:
+    """
+    Curves for all champions of the patch served by a StaticDataProviderInterface, built from
+    get_all_champions in one pass and cached per patch. Rows are found by name via row().
+    """
+    global _patch_curves
+    patch = static.get_patch_version()
+    cached = _patch_curves
+    if cached is None or cached[0] != patch:
+        with _cache_lock:
+            cached = _patch_curves
+            if cached is None or cached[0] != patch:
+                cached = _patch_curves = (patch, StatCurves.from_champions(static.get_all_champions().values()))
+    return cached[1]
+
+def curves_for_patch(patch: str) -> StatCurves:
+    """Curves for the patch's currently registered ChampionTable."""
+    return curves_for_table(ChampionTable.for_patch(patch))
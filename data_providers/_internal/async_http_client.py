@@ -0,0 +1,84 @@
+import asyncio
+import aiohttp
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+from .errors import RiotAPIError, NotFoundError
+from .http_client import ACCEPT_ENCODING
+from .rate_limiter import RateLimiter
+
+class AsyncHttpClient:
+    def __init__(self, max_retries: int = 3, backoff: float = 1.0, pool_size: int = 10, rate_limiter: RateLimiter | None = None):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the loop that actually runs the requests
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector, headers={"Accept-Encoding": ACCEPT_ENCODING})
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _acquire(self, routing: str, method: str):
+        while True:
+            wait = self.rate_limiter.reserve(routing, method)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def get(self, url: str, headers: dict = None, timeout: float = 5.0, rate_limit_method: str | None = None):
+        response = await self._send(url, headers, aiohttp.ClientTimeout(total=timeout), rate_limit_method)
+        try:
+            return await response.json(content_type=None)
+        finally:
+            response.release()
+
+    @asynccontextmanager
+    async def get_stream(self, url: str, headers: dict = None, timeout: float = 5.0, rate_limit_method: str | None = None):
+        """Yield the decoded response body as an aiohttp StreamReader instead of buffering it."""
+        # No total deadline for a streamed body, only for connecting and for each read
+        client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        response = await self._send(url, headers, client_timeout, rate_limit_method)
+        try:
+            yield response.content
+        finally:
+            response.release()
+
+    async def _send(self, url: str, headers: dict | None, timeout: aiohttp.ClientTimeout,
+                    rate_limit_method: str | None) -> aiohttp.ClientResponse:
+        session = self._get_session()
+        limiter = self.rate_limiter if rate_limit_method else None
+        routing = urlsplit(url).netloc.split(".", 1)[0]
+        for attempt in range(self.max_retries):
+            try:
+                if limiter:
+                    await self._acquire(routing, rate_limit_method)
+                response = await session.get(url, headers=headers, timeout=timeout)
+                if limiter:
+                    limiter.update(routing, rate_limit_method, response.headers)
+                if response.status == 200:
+                    return response
+                # Only 200s are handed out; read what the error needs and free the connection
+                text = await response.text() if response.status != 429 else ""
+                response.release()
+                if response.status == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    if limiter and retry_after:
+                        limiter.penalize(routing, rate_limit_method, float(retry_after), response.headers.get("X-Rate-Limit-Type"))
+                    else:
+                        await asyncio.sleep(self.backoff * (attempt + 1))
+                elif response.status == 404:
+                    raise NotFoundError(f"Error 404: {text}")
+                else:
+                    raise RiotAPIError(f"Error {response.status}: {text}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries - 1:
+                    raise RiotAPIError(f"Failed GET {url}: {e}")
+                await asyncio.sleep(self.backoff * (attempt + 1))
+        raise RiotAPIError(f"Rate limited on GET {url} after {self.max_retries} attempts")
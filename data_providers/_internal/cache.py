@@ -1,3 +1,12 @@
+import io
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO
+
+
 class CDNCache:
     def __init__(self):
         self._store = {}
@@ -8,5 +17,144 @@ class CDNCache:
     def set(self, key: str, value):
         self._store[key] = value
 
+    def keys(self) -> list[str]:
+        return list(self._store)
+
     def invalidate_all(self):
-        self._store.clear()
\ No newline at end of file
+        self._store.clear()
+
+
+def _version_sort_key(version: str):
+    parts = []
+    for part in version.split("."):
+        parts.append((0, int(part), "") if part.isdigit() else (1, 0, part))
+    return parts
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    atomic_write_stream(path, io.BytesIO(payload))
+
+
+def atomic_write_stream(path: Path, stream: IO[bytes]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            shutil.copyfileobj(stream, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class DiskCache:
+    """
+    Persistent store for raw CDN payloads, laid out as <root>/<version>/<lang>/<endpoint>.
+    Writes go through a temp file + rename so concurrent readers in other processes never
+    observe a partial file. The total size is tracked on every write; once it exceeds
+    max_bytes the cache is trimmed to low_water * max_bytes, evicting whole patch
+    directories oldest-first and then, if the patch being written is still too big on
+    its own, its least recently written files. The file just written is never evicted.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 256 * 1024 * 1024, low_water: float = 0.8):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, version: str, lang: str, endpoint: str) -> Path:
+        return self.root / version / lang / endpoint
+
+    def get(self, version: str, lang: str, endpoint: str) -> bytes | None:
+        try:
+            return self._path(version, lang, endpoint).read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def open(self, version: str, lang: str, endpoint: str) -> IO[bytes] | None:
+        try:
+            return self._path(version, lang, endpoint).open("rb")
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def set(self, version: str, lang: str, endpoint: str, payload: bytes) -> None:
+        self.set_stream(version, lang, endpoint, io.BytesIO(payload))
+
+    def set_stream(self, version: str, lang: str, endpoint: str, stream: IO[bytes]) -> None:
+        path = self._path(version, lang, endpoint)
+        try:
+            replaced = path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            replaced = 0
+        atomic_write_stream(path, stream)
+        try:
+            written = path.stat().st_size
+        except FileNotFoundError:
+            written = 0
+        with self._lock:
+            if self._size is None:
+                self._size = sum(self.size_of(v) for v in self.versions())
+            else:
+                self._size += written - replaced
+            if self._size > self.max_bytes:
+                self._evict(keep=version, written=path)
+
+    def versions(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        names = [p.name for p in self.root.iterdir() if p.is_dir() and not p.name.startswith(".")]
+        return sorted(names, key=_version_sort_key)
+
+    def _files(self, version: str) -> list[tuple[Path, int, float]]:
+        files = []
+        for dirpath, _, filenames in os.walk(self.root / version):
+            for name in filenames:
+                if name.startswith("."):
+                    # An atomic_write_stream temp file still being written
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def size_of(self, version: str) -> int:
+        return sum(size for _, size, _ in self._files(version))
+
+    def evict(self, keep: str | None = None) -> None:
+        """Trim the cache below max_bytes now, sparing the keep patch's directory if possible."""
+        with self._lock:
+            self._evict(keep)
+
+    def _evict(self, keep: str | None = None, written: Path | None = None) -> None:
+        sizes = {v: self.size_of(v) for v in self.versions()}
+        total = sum(sizes.values())
+        target = self.max_bytes * self.low_water
+        for version in sizes:
+            if total <= target:
+                break
+            if version == keep:
+                continue
+            shutil.rmtree(self.root / version, ignore_errors=True)
+            total -= sizes[version]
+        if total > target and keep is not None:
+            for path, size, _ in sorted(self._files(keep), key=lambda f: f[2]):
+                if total <= target:
+                    break
+                if path == written:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+        self._size = total
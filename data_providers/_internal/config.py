@@ -19,6 +19,15 @@ DEFAULT_GAME_NAME = prefs.get("gameName")
 DEFAULT_TAG_LINE = prefs.get("tagLine")
 REGION = prefs.get("region", "europe")
 SERVER = prefs.get("server", "euw1")
+CACHE_DIR = Path(prefs.get("cacheDir", ".cache"))
+CACHE_MAX_BYTES = int(prefs.get("cacheMaxBytes", 256 * 1024 * 1024))
+HTTP_POOL_SIZE = int(prefs.get("httpPoolSize", 10))
+APP_RATE_LIMIT = prefs.get("appRateLimit", "20:1,100:120")
+STATIC_PACK = prefs.get("staticPack")
+VERSION_TTL = float(prefs.get("versionTtl", 3600))
+PUUID_TTL = float(prefs.get("puuidTtl", 7 * 24 * 3600))
+PUUID_REVALIDATE = float(prefs.get("puuidRevalidate", 24 * 3600))
+LLM_CACHE_MAX_BYTES = int(prefs.get("llmCacheMaxBytes", 64 * 1024 * 1024))
 
 if not RIOT_API_TOKEN:
     raise EnvironmentError("Riot API token not found in user data.")
@@ -0,0 +1,147 @@
+from typing import Dict, List
+from pydantic import BaseModel, TypeAdapter
+from core.models import ChampionData, RuneEntry, RuneIndex, SummonerSpell
+
+# Stat shards are not part of runesReforged.json; IDs as used in match and spectator payloads
+STAT_SHARDS = {
+    5001: RuneEntry(name="Health Scaling", shortDesc="+10-180 Health (based on level)"),
+    5002: RuneEntry(name="Armor", shortDesc="+6 Armor"),
+    5003: RuneEntry(name="Magic Resist", shortDesc="+8 Magic Resist"),
+    5005: RuneEntry(name="Attack Speed", shortDesc="+10% Attack Speed"),
+    5007: RuneEntry(name="Ability Haste", shortDesc="+8 Ability Haste"),
+    5008: RuneEntry(name="Adaptive Force", shortDesc="+9 Adaptive Force"),
+    5010: RuneEntry(name="Move Speed", shortDesc="+2% Move Speed"),
+    5011: RuneEntry(name="Health", shortDesc="+65 Health"),
+    5013: RuneEntry(name="Tenacity and Slow Resist", shortDesc="+10% Tenacity and Slow Resist"),
+}
+
+# Schemas for the raw Data Dragon payloads. Validators are compiled once at import and can
+# be fed JSON bytes directly, so the fields we don't use are never turned into Python objects.
+class _RawStats(BaseModel):
+    hp: float
+    hpregen: float
+    mp: float
+    mpregen: float
+    armor: float
+    spellblock: float
+    attackdamage: float
+    attackspeed: float
+    movespeed: float
+    attackrange: float
+    hpperlevel: float
+    mpperlevel: float
+    armorperlevel: float
+    spellblockperlevel: float
+    attackdamageperlevel: float
+    attackspeedperlevel: float
+
+class _RawAbility(BaseModel):
+    cooldown: List[float]
+
+class _RawChampion(BaseModel):
+    id: str
+    stats: _RawStats
+    spells: List[_RawAbility] = []
+
+class _RawChampionFile(BaseModel):
+    data: Dict[str, _RawChampion]
+
+class _RawRune(BaseModel):
+    id: int
+    name: str
+    shortDesc: str = ""
+
+class _RawRuneSlot(BaseModel):
+    runes: List[_RawRune] = []
+
+class _RawRuneTree(BaseModel):
+    id: int
+    name: str
+    slots: List[_RawRuneSlot] = []
+
+class _RawSummonerSpell(BaseModel):
+    key: str
+    name: str
+    cooldown: List[float] | float
+    description: str = ""
+
+class _RawSummonerFile(BaseModel):
+    data: Dict[str, _RawSummonerSpell]
+
+_RUNE_TREES = TypeAdapter(List[_RawRuneTree])
+
+def _champion(raw: _RawChampion, name: str | None = None) -> ChampionData:
+    # Already validated against _RawChampion, so the model is built without a second pass
+    stats = raw.stats
+    cooldowns = [ability.cooldown for ability in raw.spells[:4]]
+    cooldowns += [[] for _ in range(4 - len(cooldowns))]
+    return ChampionData.model_construct(
+        name=name or raw.id,
+        base_hp=stats.hp,
+        base_hp_regen=stats.hpregen,
+        base_mp=stats.mp,
+        base_mp_regen=stats.mpregen,
+        base_armor=stats.armor,
+        base_mr=stats.spellblock,
+        base_ad=stats.attackdamage,
+        base_as=stats.attackspeed,
+        base_movespeed=stats.movespeed,
+        base_range=stats.attackrange,
+        hp_per_level=stats.hpperlevel,
+        mp_per_level=stats.mpperlevel,
+        armor_per_level=stats.armorperlevel,
+        mr_per_level=stats.spellblockperlevel,
+        ad_per_level=stats.attackdamageperlevel,
+        as_per_level=stats.attackspeedperlevel,
+        q_cooldowns=cooldowns[0],
+        w_cooldowns=cooldowns[1],
+        e_cooldowns=cooldowns[2],
+        r_cooldowns=cooldowns[3],
+    )
+
+def parse_champion(entry: dict, name: str | None = None) -> ChampionData:
+    """Build ChampionData from an already decoded champion.json, championFull.json or detail entry."""
+    return _champion(_RawChampion.model_validate(entry), name)
+
+def parse_champion_json(payload: bytes, name: str | None = None) -> ChampionData:
+    """parse_champion for a single entry still encoded as JSON."""
+    return _champion(_RawChampion.model_validate_json(payload), name)
+
+def parse_champions_json(payload: bytes) -> dict[str, ChampionData]:
+    """All entries of a champion.json or champion/<Name>.json payload, keyed by champion ID."""
+    return {champ_id: _champion(raw, champ_id) for champ_id, raw in _RawChampionFile.model_validate_json(payload).data.items()}
+
+def _runes(trees: List[_RawRuneTree]) -> dict[str, RuneEntry]:
+    return {
+        rune.name: RuneEntry.model_construct(name=rune.name, shortDesc=rune.shortDesc)
+        for tree in trees for slot in tree.slots for rune in slot.runes
+    }
+
+def _rune_index(trees: List[_RawRuneTree]) -> RuneIndex:
+    perks = dict(STAT_SHARDS)
+    styles = {}
+    perk_style = {}
+    for tree in trees:
+        styles[tree.id] = tree.name
+        for slot in tree.slots:
+            for rune in slot.runes:
+                perks[rune.id] = RuneEntry.model_construct(name=rune.name, shortDesc=rune.shortDesc)
+                perk_style[rune.id] = tree.id
+    return RuneIndex.model_construct(perks=perks, styles=styles, perk_style=perk_style, shard_ids=list(STAT_SHARDS))
+
+def parse_runes_json(payload: bytes) -> dict[str, RuneEntry]:
+    return _runes(_RUNE_TREES.validate_json(payload))
+
+def parse_rune_index_json(payload: bytes) -> RuneIndex:
+    return _rune_index(_RUNE_TREES.validate_json(payload))
+
+def _spell(spell: _RawSummonerSpell) -> SummonerSpell:
+    cooldown = spell.cooldown if isinstance(spell.cooldown, list) else [spell.cooldown]
+    return SummonerSpell.model_construct(name=spell.name, cooldown=cooldown, description=spell.description)
+
+def parse_spells_json(payload: bytes) -> dict[str, SummonerSpell]:
+    return {spell.name: _spell(spell) for spell in _RawSummonerFile.model_validate_json(payload).data.values()}
+
+def parse_spells_by_id_json(payload: bytes) -> dict[int, SummonerSpell]:
+    # Data Dragon's "key" is the numeric ID used by summoner1Id/spell1Id in game payloads
+    return {int(spell.key): _spell(spell) for spell in _RawSummonerFile.model_validate_json(payload).data.values()}
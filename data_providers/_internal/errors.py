@@ -1,6 +1,9 @@
 class RiotAPIError(Exception):
     pass
 
+class NotFoundError(RiotAPIError):
+    pass
+
 class DataMappingError(Exception):
     pass
 
@@ -8,4 +11,4 @@ class StaticDataNotFound(Exception):
     pass
 
 class GameNotFoundError(Exception):
-    pass
\ No newline at end of file
+    pass
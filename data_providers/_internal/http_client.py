@@ -1,23 +1,100 @@
 import requests
+import threading
 import time
-from .errors import RiotAPIError
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from .errors import RiotAPIError, NotFoundError
+from .rate_limiter import RateLimiter
+
+# gzip/deflate always; br only when urllib3 can decode it (brotli installed)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
 
 class HttpClient:
-    def __init__(self, max_retries: int = 3, backoff: float = 1.0):
+    def __init__(self, max_retries: int = 3, backoff: float = 1.0, pool_size: int = 10, rate_limiter: RateLimiter | None = None):
         self.max_retries = max_retries
         self.backoff = backoff
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def _session_for(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"})
+                self._sessions[host] = session
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def get(self, url: str, headers: dict = None, timeout: float = 5.0, rate_limit_method: str | None = None):
+        return self._send(url, headers, timeout, rate_limit_method).json()
+
+    def get_conditional(self, url: str, etag: str | None = None, last_modified: str | None = None, timeout: float = 5.0):
+        """
+        Conditional GET using the validators of a previous response. Returns
+        (body, etag, last_modified); body is None when the server answered 304.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = self._send(url, headers, timeout, None, accept=(200, 304))
+        if response.status_code == 304:
+            return None, etag, last_modified
+        return response.json(), response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    @contextmanager
+    def get_stream(self, url: str, headers: dict = None, timeout: float = 5.0, rate_limit_method: str | None = None):
+        """Yield the decoded response body as a file-like object instead of buffering it."""
+        response = self._send(url, headers, timeout, rate_limit_method, stream=True)
+        try:
+            response.raw.decode_content = True
+            yield response.raw
+        finally:
+            response.close()
 
-    def get(self, url: str, headers: dict = None, timeout: float = 5.0):
+    def _send(self, url: str, headers: dict | None, timeout: float, rate_limit_method: str | None, accept=(200,),
+              stream: bool = False) -> requests.Response:
+        session = self._session_for(url)
+        limiter = self.rate_limiter if rate_limit_method else None
+        routing = urlsplit(url).netloc.split(".", 1)[0]
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, headers=headers, timeout=timeout)
-                if response.status_code == 200:
-                    return response.json()
+                if limiter:
+                    limiter.acquire(routing, rate_limit_method)
+                response = session.get(url, headers=headers, timeout=timeout, stream=stream)
+                if limiter:
+                    limiter.update(routing, rate_limit_method, response.headers)
+                if response.status_code in accept:
+                    return response
                 elif response.status_code == 429:
-                    time.sleep(self.backoff * (attempt + 1))
+                    # Nobody reads a 429's body, so a streamed one would keep its pooled connection
+                    response.close()
+                    retry_after = response.headers.get("Retry-After")
+                    if limiter and retry_after:
+                        limiter.penalize(routing, rate_limit_method, float(retry_after), response.headers.get("X-Rate-Limit-Type"))
+                    else:
+                        time.sleep(self.backoff * (attempt + 1))
+                elif response.status_code == 404:
+                    raise NotFoundError(f"Error 404: {response.text}")
                 else:
                     raise RiotAPIError(f"Error {response.status_code}: {response.text}")
             except requests.RequestException as e:
                 if attempt == self.max_retries - 1:
                     raise RiotAPIError(f"Failed GET {url}: {e}")
-                time.sleep(self.backoff * (attempt + 1))
\ No newline at end of file
+                time.sleep(self.backoff * (attempt + 1))
+        raise RiotAPIError(f"Rate limited on GET {url} after {self.max_retries} attempts")
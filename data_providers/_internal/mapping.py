@@ -1,47 +1,108 @@
-from core.models import GameData, PlayerGameEntry, PlayerRole, TeamSide, Runes, RuneEntry
-from core.models import SummonerSpell, ChampionData
+from core.models import GameData, PlayerGameEntry, PlayerRole, TeamSide, Runes, RuneEntry, RuneIndex
+from core.models import SummonerSpell, ChampionData, ChampionTable
+from typing import get_args
 from data_providers.static_data import StaticDataProvider
+from data_providers._internal.errors import DataMappingError
 
-def map_raw_to_game_data(raw_data: dict, user_name: str, static: StaticDataProvider) -> GameData:
-    runes_lookup = static.get_all_runes()
-    spells_lookup = static.get_spell_data()
+class StaticTables:
+    """Static lookups resolved once and shared by every game mapped from the same provider state."""
+
+    def __init__(self, static: StaticDataProvider):
+        self.static = static
+        self.patch = static.get_patch_version()
+        self.rune_index = static.get_rune_index()
+        self.spells_by_id = static.get_spell_data_by_id()
+        self.champions: dict[str, ChampionData] = {}
+        self.champion_table = ChampionTable.for_patch(self.patch)
+        self._champion_ids: dict[str, int] = {}
+
+    def prefetch(self, names) -> None:
+        missing = [name for name in dict.fromkeys(names) if name not in self.champions]
+        if missing:
+            self.champions.update(self.static.get_champions_data(missing))
+
+    def champion(self, name: str) -> ChampionData:
+        champ = self.champions.get(name)
+        if champ is None:
+            champ = self.static.get_champion_data(name)
+            self.champions[name] = champ
+        return champ
+
+    def champion_id(self, name: str) -> int:
+        """Row of the champion in this patch's shared ChampionTable."""
+        champion_id = self._champion_ids.get(name)
+        if champion_id is None:
+            champion_id = self._champion_ids[name] = self.champion_table.intern(self.champion(name))
+        return champion_id
+
+# match-v5 reports teamPosition with Riot's naming; spectator payloads have none
+_ROLE_ALIASES = {"MIDDLE": "MID", "UTILITY": "SUPPORT", "": "TOP"}
+_ROLES = frozenset(get_args(PlayerRole))
+
+def get_participants(raw_data: dict) -> list[dict]:
+    # Spectator payloads list participants at the top level, match-v5 nests them under "info"
+    return raw_data.get("participants") or raw_data.get("info", {}).get("participants", [])
+
+_STAT_PERK_ORDER = ("offense", "flex", "defense")
+
+def map_runes(perks: dict, index: RuneIndex) -> Runes:
+    if "perkIds" in perks:
+        # spectator-v5: flat perk list, split by the style each perk belongs to
+        ids = perks.get("perkIds", [])
+        primary_ids = [i for i in ids if index.perk_style.get(i) == perks.get("perkStyle")]
+        secondary_ids = [i for i in ids if index.perk_style.get(i) == perks.get("perkSubStyle")]
+        shard_ids = [i for i in ids if i not in index.perk_style]
+    else:
+        # match-v5: explicit primary/sub styles plus a statPerks block
+        primary_ids, secondary_ids = [], []
+        for style in perks.get("styles", []):
+            selected = [sel.get("perk") for sel in style.get("selections", [])]
+            if style.get("description") == "primaryStyle":
+                primary_ids = selected
+            elif style.get("description") == "subStyle":
+                secondary_ids = selected
+        stat_perks = perks.get("statPerks", {})
+        shard_ids = [stat_perks[key] for key in _STAT_PERK_ORDER if key in stat_perks]
+
+    primary = [index.perks[i] for i in primary_ids if i in index.perks]
+    secondary = [index.perks[i] for i in secondary_ids if i in index.perks]
+    shards = [index.perks.get(i) or RuneEntry.model_construct(name=f"Shard {i}", shortDesc="") for i in shard_ids]
+    # Every entry comes from the per-patch RuneIndex, which was validated when it was built
+    return Runes.model_construct(
+        keystone=primary[0] if primary else RuneEntry.model_construct(name="Unknown", shortDesc=""),
+        primary=primary,
+        secondary=secondary,
+        shards=shards,
+    )
+
+def map_raw_to_game_data(raw_data: dict, user_name: str, static: StaticDataProvider, tables: StaticTables | None = None) -> GameData:
+    tables = tables or StaticTables(static)
+    rune_index = tables.rune_index
+    spells_by_id = tables.spells_by_id
     players = []
+    participants = get_participants(raw_data)
+    tables.prefetch(p.get("championName", "Aatrox") for p in participants)
 
-    for p in raw_data.get("participants", []):
+    for p in participants:
         role = p.get("teamPosition", "TOP")
+        role = _ROLE_ALIASES.get(role, role)
+        if role not in _ROLES:
+            raise DataMappingError(f"Unknown teamPosition {role!r}")
         team = "ALLY" if p.get("summonerName", "") == user_name else "ENEMY"
-        champ = static.get_champion_data(p.get("championName", "Aatrox"))
-
-        primary = []
-        secondary = []
-        shards = []
-        for s in p.get("perks", {}).get("styles", []):
-            if s.get("description") == "primaryStyle":
-                primary = [runes_lookup.get(r.get("name"), None) for r in s.get("selections", []) if runes_lookup.get(r.get("name"))]
-            elif s.get("description") == "subStyle":
-                secondary = [runes_lookup.get(r.get("name"), None) for r in s.get("selections", []) if runes_lookup.get(r.get("name"))]
-        shards = [runes_lookup.get(str(s), RuneEntry(name=f"Shard {s}", shortDesc="")) for s in p.get("perks", {}).get("statPerks", {}).values()]
-
-        runes = Runes(
-            keystone=primary[0] if primary else RuneEntry(name="Unknown", shortDesc=""),
-            primary=primary,
-            secondary=secondary,
-            shards=shards,
-        )
+        champion_id = tables.champion_id(p.get("championName", "Aatrox"))
 
-        spell_names = [p.get("summoner1Id"), p.get("summoner2Id")]
-        spell_list = []
-        for sid in spell_names:
-            for name, spell in spells_lookup.items():
-                if str(sid) in name or name.lower().startswith("summoner"):
-                    spell_list.append(name)
-                    break
+        runes = map_runes(p.get("perks", {}), rune_index)
 
-        full_champ_data = static.get_champion_data(p.get("championName", "Aatrox"))
+        # match-v5 uses summoner1Id/summoner2Id, spectator-v5 uses spell1Id/spell2Id
+        spell_ids = [p.get("summoner1Id", p.get("spell1Id")), p.get("summoner2Id", p.get("spell2Id"))]
+        spell_list = [spells_by_id[sid].name for sid in spell_ids if sid in spells_by_id]
 
-        entry = PlayerGameEntry(
-            summoner_name=p.get("summonerName", ""),
-            champion=full_champ_data,
+        # Trusted construction: champion rows and runes are validated once per patch, and the
+        # remaining fields are checked above, so nothing is re-validated per game
+        entry = PlayerGameEntry.model_construct(
+            summoner_name=p.get("summonerName") or "",
+            champion_id=champion_id,
+            patch=tables.patch,
             runes=runes,
             summoner_spells=spell_list,
             role=role,
@@ -50,10 +111,12 @@ def map_raw_to_game_data(raw_data: dict, user_name: str, static: StaticDataProvi
         players.append(entry)
 
     user_role = next((p.role for p in players if p.summoner_name == user_name), "TOP")
+    game_id = raw_data.get("gameId", raw_data.get("info", {}).get("gameId", "unknown"))
 
-    return GameData(
-        game_id=str(raw_data.get("gameId", "unknown")),
+    return GameData.model_construct(
+        game_id=str(game_id),
         summoner_name=user_name,
         players=players,
         user_role=user_role,
+        patch_version=tables.patch,
     )
@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO
+
+class MatchStore:
+    """
+    Write-once store for finished match-v5 payloads. Each payload is gzip-compressed and
+    content-addressed as <root>/objects/<aa>/<sha256>.json.gz; index.jsonl maps match IDs
+    to digests. The index is append-only, so other processes' additions are picked up by
+    reading whatever was appended since the last look.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.index_path = self.root / "index.jsonl"
+        self._index: dict[str, str] = {}
+        self._index_offset = 0
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.json.gz"
+
+    def _refresh_index(self) -> None:
+        try:
+            with self.index_path.open("rb") as f:
+                f.seek(self._index_offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        # Ignore a trailing partial line; it is re-read once its writer finishes it
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._index[entry["match_id"]] = entry["digest"]
+        self._index_offset += len(complete)
+
+    def _digest_for(self, match_id: str) -> str | None:
+        with self._lock:
+            if match_id not in self._index:
+                self._refresh_index()
+            return self._index.get(match_id)
+
+    def has(self, match_id: str) -> bool:
+        return self._digest_for(match_id) is not None
+
+    def open(self, match_id: str) -> IO[bytes] | None:
+        """Stream the decompressed payload without materialising it; None when not stored."""
+        digest = self._digest_for(match_id)
+        if digest is None:
+            return None
+        try:
+            return gzip.open(self._object_path(digest), "rb")
+        except FileNotFoundError:
+            return None
+
+    def get(self, match_id: str) -> dict | None:
+        stream = self.open(match_id)
+        if stream is None:
+            return None
+        with stream:
+            return json.load(stream)
+
+    def put(self, match_id: str, payload: dict) -> None:
+        if self.has(match_id):
+            return
+        self.put_stream(match_id, io.BytesIO(json.dumps(payload, separators=(",", ":")).encode("utf-8")))
+
+    def put_stream(self, match_id: str, stream: IO[bytes]) -> None:
+        """Compress a raw payload stream into the store, hashing it on the way through."""
+        if self.has(match_id):
+            return
+        objects = self.root / "objects"
+        objects.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=objects, suffix=".tmp")
+        sha = hashlib.sha256()
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+                for chunk in iter(lambda: stream.read(64 * 1024), b""):
+                    sha.update(chunk)
+                    gz.write(chunk)
+            digest = sha.hexdigest()
+            path = self._object_path(digest)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists():
+                os.unlink(tmp_name)
+            else:
+                os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        line = json.dumps({"match_id": match_id, "digest": digest}).encode("utf-8") + b"\n"
+        # A single O_APPEND write keeps concurrent appenders from interleaving lines
+        fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        with self._lock:
+            self._index[match_id] = digest
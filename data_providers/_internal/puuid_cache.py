@@ -0,0 +1,41 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from .cache import atomic_write_bytes
+
+class PuuidCache:
+    """
+    Riot ID -> PUUID store shared across processes, one small JSON file per Riot ID.
+    Riot IDs are case-insensitive, so keys are normalised before hashing.
+    """
+
+    def __init__(self, root: Path, ttl: float = 7 * 24 * 3600, clock=time.time):
+        self.root = Path(root)
+        self.ttl = ttl
+        self._clock = clock
+
+    def _path(self, game_name: str, tag_line: str) -> Path:
+        key = f"{game_name.strip().lower()}#{tag_line.strip().lower()}"
+        return self.root / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, game_name: str, tag_line: str, max_age: float | None = None) -> str | None:
+        """The cached PUUID, or None if missing, expired, or older than max_age seconds."""
+        try:
+            entry = json.loads(self._path(game_name, tag_line).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+        age = self._clock() - entry.get("stored_at", 0)
+        if age >= self.ttl or (max_age is not None and age >= max_age):
+            return None
+        return entry.get("puuid")
+
+    def set(self, game_name: str, tag_line: str, puuid: str) -> None:
+        entry = {"game_name": game_name, "tag_line": tag_line, "puuid": puuid, "stored_at": self._clock()}
+        atomic_write_bytes(self._path(game_name, tag_line), json.dumps(entry).encode("utf-8"))
+
+    def invalidate(self, game_name: str, tag_line: str) -> None:
+        try:
+            self._path(game_name, tag_line).unlink()
+        except FileNotFoundError:
+            pass
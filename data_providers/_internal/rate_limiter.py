@@ -0,0 +1,139 @@
+import threading
+import time
+from collections import deque
+
+
+def parse_rate_header(value: str | None) -> list[tuple[int, int]]:
+    """
+    Parse a Riot rate header such as "20:1,100:120" into [(20, 1), (100, 120)].
+    Works for both limit headers (limit:window) and count headers (count:window).
+    """
+    pairs = []
+    if not value:
+        return pairs
+    for chunk in value.split(","):
+        if ":" not in chunk:
+            continue
+        amount, window = chunk.split(":", 1)
+        try:
+            pairs.append((int(amount), int(window)))
+        except ValueError:
+            continue
+    return pairs
+
+
+class _RateBucket:
+    """Sliding-window log for a single limit:window pair."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._stamps: deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        while self._stamps and self._stamps[0] <= now - self.window:
+            self._stamps.popleft()
+
+    def wait_time(self, now: float) -> float:
+        self._trim(now)
+        if len(self._stamps) < self.limit:
+            return 0.0
+        return self._stamps[0] + self.window - now
+
+    def record(self, now: float) -> None:
+        self._stamps.append(now)
+
+    def sync_count(self, count: int, now: float) -> None:
+        # The server may have seen requests we did not (other processes sharing the key)
+        self._trim(now)
+        missing = min(count, self.limit) - len(self._stamps)
+        for _ in range(missing):
+            self._stamps.append(now)
+
+
+class RateLimiter:
+    """
+    Proactive limiter for Riot API calls. Application limits are tracked per routing
+    value (e.g. "europe", "euw1"), method limits per (routing value, method). Limits
+    start from the configured defaults and are replaced by whatever the X-*-Rate-Limit
+    headers report; the -Count headers and Retry-After keep the local view in sync.
+    """
+
+    def __init__(self, default_app_limits: str = "20:1,100:120", clock=time.monotonic):
+        self.default_app_limits = parse_rate_header(default_app_limits)
+        self._clock = clock
+        self._app: dict[str, list[_RateBucket]] = {}
+        self._method: dict[tuple[str, str], list[_RateBucket]] = {}
+        self._blocked_until: dict[tuple[str, str | None], float] = {}
+        self._lock = threading.Lock()
+
+    def _buckets(self, routing: str, method: str) -> list[_RateBucket]:
+        if routing not in self._app:
+            self._app[routing] = [_RateBucket(limit, window) for limit, window in self.default_app_limits]
+        return self._app[routing] + self._method.get((routing, method), [])
+
+    def reserve(self, routing: str, method: str) -> float:
+        """
+        Try to take a slot for one request. Returns 0.0 when the request was admitted,
+        otherwise the number of seconds to wait before trying again.
+        """
+        with self._lock:
+            now = self._clock()
+            wait = max(
+                self._blocked_until.get((routing, None), 0.0) - now,
+                self._blocked_until.get((routing, method), 0.0) - now,
+                0.0,
+            )
+            buckets = self._buckets(routing, method)
+            for bucket in buckets:
+                wait = max(wait, bucket.wait_time(now))
+            if wait > 0:
+                return wait
+            for bucket in buckets:
+                bucket.record(now)
+            return 0.0
+
+    def acquire(self, routing: str, method: str) -> None:
+        while True:
+            wait = self.reserve(routing, method)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def update(self, routing: str, method: str, headers) -> None:
+        with self._lock:
+            now = self._clock()
+            self._app[routing] = self._rebuild(
+                self._app.get(routing, []),
+                parse_rate_header(headers.get("X-App-Rate-Limit")),
+                parse_rate_header(headers.get("X-App-Rate-Limit-Count")),
+                now,
+            )
+            self._method[(routing, method)] = self._rebuild(
+                self._method.get((routing, method), []),
+                parse_rate_header(headers.get("X-Method-Rate-Limit")),
+                parse_rate_header(headers.get("X-Method-Rate-Limit-Count")),
+                now,
+            )
+
+    def _rebuild(self, buckets: list[_RateBucket], limits, counts, now: float) -> list[_RateBucket]:
+        if not limits:
+            return buckets
+        existing = {bucket.window: bucket for bucket in buckets}
+        rebuilt = []
+        for limit, window in limits:
+            bucket = existing.get(window) or _RateBucket(limit, window)
+            bucket.limit = limit
+            rebuilt.append(bucket)
+        by_window = {bucket.window: bucket for bucket in rebuilt}
+        for count, window in counts:
+            if window in by_window:
+                by_window[window].sync_count(count, now)
+        return rebuilt
+
+    def penalize(self, routing: str, method: str, retry_after: float, limit_type: str | None = None) -> None:
+        """Block further requests after a 429; app-level limits block the whole routing value."""
+        key = (routing, None) if limit_type == "application" else (routing, method)
+        with self._lock:
+            until = self._clock() + retry_after
+            self._blocked_until[key] = max(self._blocked_until.get(key, 0.0), until)
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key: the first caller runs fn, callers arriving while
+    it is in flight wait for it and get the same result (or exception). Nothing is
+    remembered once the call finishes; caching stays the caller's job.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+class AsyncSingleFlight:
+    """SingleFlight for coroutines running on one event loop."""
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # Shield so one cancelled waiter does not cancel the fetch the others share
+        return await asyncio.shield(task)
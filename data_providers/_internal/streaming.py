@@ -0,0 +1,80 @@
+"""
+Incremental JSON decoding for the large payloads we only need a slice of.
+
+With ijson installed, match payloads are decoded event by event and every participant
+keeps only the fields the mappers use, so the full match-v5 document (timelines of
+challenges, pings, items, ...) never exists as Python objects. Without ijson the same
+projections are applied after a regular json.load.
+"""
+import json
+from typing import IO, Iterator
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # optional dependency
+    ijson = None
+
+PARTICIPANT_FIELDS = frozenset({
+    # identity and placement
+    "puuid", "summonerName", "riotIdGameName", "riotIdTagline", "teamId", "teamPosition",
+    # loadout
+    "championId", "championName", "summoner1Id", "summoner2Id", "perks",
+    # end-of-game stats
+    "champLevel", "kills", "deaths", "assists", "goldEarned", "totalMinionsKilled",
+    "neutralMinionsKilled", "totalDamageDealtToChampions", "visionScore", "win",
+})
+
+_PARTICIPANT_PREFIX = "info.participants.item"
+_SCALARS = {"metadata.matchId": ("metadata", "matchId"), "info.gameId": ("info", "gameId")}
+
+def project_participant(participant: dict) -> dict:
+    return {key: value for key, value in participant.items() if key in PARTICIPANT_FIELDS}
+
+def project_match(payload: dict) -> dict:
+    info = payload.get("info", {})
+    return {
+        "metadata": {"matchId": payload.get("metadata", {}).get("matchId")},
+        "info": {
+            "gameId": info.get("gameId"),
+            "participants": [project_participant(p) for p in info.get("participants", [])],
+        },
+    }
+
+def read_match_summary(stream: IO[bytes]) -> dict:
+    """Decode a match-v5 payload from a byte stream into the shape returned by project_match."""
+    if ijson is None:
+        return project_match(json.load(stream))
+
+    summary = {"metadata": {"matchId": None}, "info": {"gameId": None, "participants": []}}
+    builder = None
+    skipping = False
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            if prefix == _PARTICIPANT_PREFIX:
+                if event == "map_key":
+                    skipping = value not in PARTICIPANT_FIELDS
+                    if skipping:
+                        continue
+                elif event == "end_map":
+                    builder.event(event, value)
+                    summary["info"]["participants"].append(builder.value)
+                    builder = None
+                    continue
+            if not skipping:
+                builder.event(event, value)
+        elif prefix == _PARTICIPANT_PREFIX and event == "start_map":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+            skipping = False
+        elif prefix in _SCALARS and event not in ("start_map", "start_array", "map_key"):
+            section, key = _SCALARS[prefix]
+            summary[section][key] = value
+    return summary
+
+def iter_champion_entries(stream: IO[bytes]) -> Iterator[tuple[str, dict]]:
+    """Yield (champion id, entry) pairs from champion.json one champion at a time."""
+    if ijson is None:
+        yield from json.load(stream)["data"].items()
+        return
+    yield from ijson.kvitems(stream, "data", use_float=True)
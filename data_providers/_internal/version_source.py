@@ -0,0 +1,70 @@
+import json
+import threading
+import time
+from pathlib import Path
+from .cache import atomic_write_bytes
+from .errors import RiotAPIError
+from .http_client import HttpClient
+
+VERSIONS_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
+
+class PatchVersionSource:
+    """
+    Latest Data Dragon version with a TTL. The last answer and its ETag/Last-Modified
+    validators are persisted to state_path, so short-lived processes within the TTL
+    skip the request entirely and later ones usually only pay for a 304.
+    """
+
+    def __init__(self, http: HttpClient, state_path: Path, ttl: float = 3600.0, clock=time.time):
+        self.http = http
+        self.state_path = Path(state_path)
+        self.ttl = ttl
+        self._clock = clock
+        self._state: dict | None = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, state: dict | None) -> bool:
+        return bool(state) and self._clock() - state.get("checked_at", 0) < self.ttl
+
+    def _load(self) -> dict | None:
+        try:
+            return json.loads(self.state_path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def latest(self) -> str:
+        if self._is_fresh(self._state):
+            return self._state["version"]
+        with self._lock:
+            if self._is_fresh(self._state):
+                return self._state["version"]
+            # Another process may have refreshed the shared state since we last looked
+            state = self._load()
+            if self._is_fresh(state):
+                self._state = state
+                return state["version"]
+            state = state or {}
+            try:
+                versions, etag, last_modified = self.http.get_conditional(
+                    VERSIONS_URL, state.get("etag"), state.get("last_modified")
+                )
+            except RiotAPIError:
+                if state.get("version"):
+                    return state["version"]
+                raise
+            if versions is None and state.get("version"):
+                version = state["version"]
+            elif versions is None:
+                # 304 without a remembered version: fall back to a plain fetch
+                versions, etag, last_modified = self.http.get_conditional(VERSIONS_URL)
+                version = versions[0]
+            else:
+                version = versions[0]
+            self._state = {
+                "version": version,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": self._clock(),
+            }
+            atomic_write_bytes(self.state_path, json.dumps(self._state).encode("utf-8"))
+            return version
@@ -0,0 +1,71 @@
+# async_game_data_assembler.py
+import asyncio
+import logging
+from itertools import islice
+from typing import AsyncIterator, Iterable
+from data_providers.interfaces import AsyncGameDataInterface
+from data_providers.async_riot_client import AsyncRiotApiClient
+from data_providers.static_data import StaticDataProvider
+from data_providers.static_pack import StaticPackProvider
+from data_providers._internal.mapping import map_raw_to_game_data, StaticTables
+from data_providers._internal.async_http_client import AsyncHttpClient
+from data_providers._internal.http_client import HttpClient
+from data_providers._internal.rate_limiter import RateLimiter
+from data_providers._internal.config import HTTP_POOL_SIZE, APP_RATE_LIMIT, STATIC_PACK
+from core.models import GameData
+
+logger = logging.getLogger(__name__)
+
+class AsyncGameDataAssembler(AsyncGameDataInterface):
+    def __init__(self, max_concurrency: int = 10):
+        self.riot = AsyncRiotApiClient(
+            http=AsyncHttpClient(pool_size=HTTP_POOL_SIZE, rate_limiter=RateLimiter(APP_RATE_LIMIT)),
+            max_concurrency=max_concurrency,
+        )
+        # Static data stays synchronous; it is disk-cached (or packed) and mapped off the event loop
+        self.static = StaticPackProvider(STATIC_PACK) if STATIC_PACK else StaticDataProvider(http=HttpClient(pool_size=HTTP_POOL_SIZE))
+
+    async def close(self):
+        await self.riot.close()
+
+    async def get_live_game_info(self, game_name: str, tag_line: str) -> GameData:
+        puuid = await self.riot.get_puuid(game_name, tag_line)
+        raw = await self.riot.get_active_game(puuid)
+        return await asyncio.to_thread(map_raw_to_game_data, raw, game_name, self.static)
+
+    async def get_historical_game(self, match_id: str, game_name: str, tag_line: str) -> GameData:
+        raw = await self.riot.get_match_summary(match_id)
+        return await asyncio.to_thread(map_raw_to_game_data, raw, game_name, self.static)
+
+    async def get_historical_games(self, match_ids: Iterable[str], game_name: str, tag_line: str) -> AsyncIterator[GameData]:
+        """
+        Async counterpart of GameDataAssembler.get_historical_games: yields GameData in
+        completion order from the same 2 * max_concurrency window, skipping matches that
+        fail. The window only keeps the next matches queued; the client's shared semaphore
+        holds the requests actually on the wire to max_concurrency.
+        """
+        ids = iter(dict.fromkeys(match_ids))
+        tables = await asyncio.to_thread(StaticTables, self.static)
+        window = self.riot.max_concurrency * 2
+        pending = {asyncio.create_task(self.riot.get_match_summary(mid)): mid for mid in islice(ids, window)}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    match_id = pending.pop(task)
+                    next_id = next(ids, None)
+                    if next_id is not None:
+                        pending[asyncio.create_task(self.riot.get_match_summary(next_id))] = next_id
+                    try:
+                        game = await asyncio.to_thread(map_raw_to_game_data, task.result(), game_name, self.static, tables)
+                    except Exception as e:
+                        logger.warning("Skipping match %s: %s: %s", match_id, type(e).__name__, e)
+                        continue
+                    yield game
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_recent_game_ids(self, game_name: str, tag_line: str, count: int = 10) -> list[str]:
+        puuid = await self.riot.get_puuid(game_name, tag_line)
+        return await self.riot.get_match_ids(puuid, count)
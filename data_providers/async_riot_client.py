@@ -0,0 +1,142 @@
+import asyncio
+import tempfile
+from contextlib import asynccontextmanager
+from data_providers.interfaces import AsyncRiotApiClientInterface
+from data_providers._internal.config import REGION, SERVER, HTTP_POOL_SIZE, APP_RATE_LIMIT, CACHE_DIR, PUUID_TTL, PUUID_REVALIDATE, get_headers
+from data_providers._internal.async_http_client import AsyncHttpClient
+from data_providers._internal.rate_limiter import RateLimiter
+from data_providers._internal.puuid_cache import PuuidCache
+from data_providers._internal.match_store import MatchStore
+from data_providers._internal.errors import NotFoundError, RiotAPIError
+from data_providers._internal.streaming import project_match, read_match_summary
+from data_providers._internal.single_flight import AsyncSingleFlight
+from urllib.parse import quote
+
+class AsyncRiotApiClient(AsyncRiotApiClientInterface):
+    def __init__(self, http: AsyncHttpClient | None = None, max_concurrency: int = 10, puuid_cache: PuuidCache | None = None,
+                 match_store: MatchStore | None = None, puuid_revalidate: float = PUUID_REVALIDATE):
+        self.http = http or AsyncHttpClient(pool_size=HTTP_POOL_SIZE, rate_limiter=RateLimiter(APP_RATE_LIMIT))
+        self.puuid_cache = puuid_cache or PuuidCache(CACHE_DIR / "puuids", PUUID_TTL)
+        self.match_store = match_store or MatchStore(CACHE_DIR / "matches")
+        self.max_concurrency = max_concurrency
+        # Shared by every request this client makes, so callers can fan out freely
+        self._wire = asyncio.Semaphore(max_concurrency)
+        self.base_general = f"https://{SERVER}.api.riotgames.com"
+        self.base_regional = f"https://{REGION}.api.riotgames.com"
+        self.puuid_revalidate = puuid_revalidate
+        # PUUIDs served from the cache -> the Riot ID they were cached for, so a 404 on a call
+        # that used one can drop the stale mapping
+        self._puuid_owners: dict[str, tuple[str, str]] = {}
+        self._flights = AsyncSingleFlight()
+
+    async def close(self):
+        await self.http.close()
+
+    async def _get(self, url: str, rate_limit_method: str):
+        async with self._wire:
+            return await self.http.get(url, headers=get_headers(), rate_limit_method=rate_limit_method)
+
+    @asynccontextmanager
+    async def _get_stream(self, url: str, rate_limit_method: str):
+        async with self._wire:
+            async with self.http.get_stream(url, headers=get_headers(), rate_limit_method=rate_limit_method) as body:
+                yield body
+
+    async def get_puuid(self, game_name: str, tag_line: str) -> str:
+        # Riot IDs can be renamed, so cached mappings older than puuid_revalidate are re-checked
+        cached = self.puuid_cache.get(game_name, tag_line, max_age=self.puuid_revalidate)
+        if cached:
+            self._puuid_owners[cached] = (game_name, tag_line)
+            return cached
+        key = ("puuid", game_name.lower(), tag_line.lower())
+        return await self._flights.do(key, lambda: self._fetch_puuid(game_name, tag_line))
+
+    async def _fetch_puuid(self, game_name: str, tag_line: str) -> str:
+        encoded_name = quote(game_name)
+        encoded_tag = quote(tag_line)
+        url = f"{self.base_regional}/riot/account/v1/accounts/by-riot-id/{encoded_name}/{encoded_tag}"
+        try:
+            puuid = (await self._get(url, "account-v1.by-riot-id"))["puuid"]
+        except NotFoundError:
+            self.puuid_cache.invalidate(game_name, tag_line)
+            raise
+        except RiotAPIError:
+            # Revalidation failed for another reason; an unexpired mapping is still usable
+            stale = self.puuid_cache.get(game_name, tag_line)
+            if stale is None:
+                raise
+            return stale
+        self.puuid_cache.set(game_name, tag_line, puuid)
+        self._puuid_owners[puuid] = (game_name, tag_line)
+        return puuid
+
+    def invalidate_puuid(self, game_name: str, tag_line: str) -> None:
+        self.puuid_cache.invalidate(game_name, tag_line)
+
+    def _forget_puuid(self, puuid: str) -> None:
+        owner = self._puuid_owners.pop(puuid, None)
+        if owner is not None:
+            self.puuid_cache.invalidate(*owner)
+
+    async def get_active_game(self, puuid: str) -> dict:
+        url = f"{self.base_general}/lol/spectator/v5/active-games/by-summoner/{puuid}"
+        return await self._flights.do(
+            ("active-game", puuid),
+            lambda: self._get(url, "spectator-v5.active-games"),
+        )
+
+    async def get_match_ids(self, puuid: str, count: int = 10) -> list[str]:
+        url = f"{self.base_regional}/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count={count}"
+        try:
+            return await self._get(url, "match-v5.ids-by-puuid")
+        except NotFoundError:
+            # Unlike spectator-v5 (404 = not in game), a 404 here means the PUUID itself is unknown
+            self._forget_puuid(puuid)
+            raise
+
+    async def get_match_details(self, match_id: str) -> dict:
+        stored = self.match_store.get(match_id)
+        if stored is not None:
+            return stored
+        return await self._flights.do(("match", match_id), lambda: self._fetch_match(match_id))
+
+    async def _fetch_match(self, match_id: str) -> dict:
+        url = f"{self.base_regional}/lol/match/v5/matches/{match_id}"
+        payload = await self._get(url, "match-v5.match")
+        self.match_store.put(match_id, payload)
+        return payload
+
+    async def get_match_summary(self, match_id: str) -> dict:
+        stream = self.match_store.open(match_id)
+        if stream is None:
+            await self._flights.do(("match-stream", match_id), lambda: self._store_match(match_id))
+            stream = self.match_store.open(match_id)
+        if stream is None:
+            return project_match(await self._fetch_match(match_id))
+        with stream:
+            return await asyncio.to_thread(read_match_summary, stream)
+
+    async def _store_match(self, match_id: str) -> None:
+        if self.match_store.has(match_id):
+            return
+        url = f"{self.base_regional}/lol/match/v5/matches/{match_id}"
+        # Spool the body to disk as it arrives, then compress it into the store; every disk
+        # write runs on a worker thread so a large download never blocks the event loop
+        with await asyncio.to_thread(tempfile.TemporaryFile) as spool:
+            async with self._get_stream(url, "match-v5.match") as body:
+                async for chunk in body.iter_chunked(64 * 1024):
+                    await asyncio.to_thread(spool.write, chunk)
+            await asyncio.to_thread(spool.seek, 0)
+            await asyncio.to_thread(self.match_store.put_stream, match_id, spool)
+
+    async def _fan_out(self, keys: list, fetch) -> dict:
+        # The wire semaphore in _get bounds the requests; cached keys complete without waiting
+        unique = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(fetch(key) for key in unique))
+        return dict(zip(unique, results))
+
+    async def get_many_match_details(self, match_ids: list[str]) -> dict[str, dict]:
+        return await self._fan_out(match_ids, self.get_match_details)
+
+    async def get_many_puuids(self, riot_ids: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+        return await self._fan_out(riot_ids, lambda riot_id: self.get_puuid(*riot_id))
@@ -1,24 +1,69 @@
 # game_data_assembler.py
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Iterable, Iterator
 from data_providers.interfaces import GameDataInterface
 from data_providers.riot_client import RiotApiClient
 from data_providers.static_data import StaticDataProvider
-from data_providers._internal.mapping import map_raw_to_game_data
+from data_providers.static_pack import StaticPackProvider
+from data_providers._internal.mapping import map_raw_to_game_data, StaticTables
+from data_providers._internal.http_client import HttpClient
+from data_providers._internal.rate_limiter import RateLimiter
+from data_providers._internal.config import HTTP_POOL_SIZE, APP_RATE_LIMIT, STATIC_PACK
 from core.models import GameData
 
+logger = logging.getLogger(__name__)
+
 class GameDataAssembler(GameDataInterface):
-    def __init__(self):
-        self.riot = RiotApiClient()
-        self.static = StaticDataProvider()
+    def __init__(self, max_concurrency: int = 10):
+        self.max_concurrency = max_concurrency
+        self.http = HttpClient(pool_size=HTTP_POOL_SIZE, rate_limiter=RateLimiter(APP_RATE_LIMIT))
+        self.riot = RiotApiClient(http=self.http)
+        self.static = StaticPackProvider(STATIC_PACK) if STATIC_PACK else StaticDataProvider(http=self.http)
 
     def get_live_game_info(self, game_name: str, tag_line: str) -> GameData:
         puuid = self.riot.get_puuid(game_name, tag_line)
         raw = self.riot.get_active_game(puuid)
         return map_raw_to_game_data(raw, game_name, self.static)
 
+    def map_live_game(self, raw: dict, game_name: str) -> GameData:
+        """Map a spectator payload that was already fetched, e.g. by LiveGameWatcher."""
+        return map_raw_to_game_data(raw, game_name, self.static)
+
     def get_historical_game(self, match_id: str, game_name: str, tag_line: str) -> GameData:
-        raw = self.riot.get_match_details(match_id)
+        raw = self.riot.get_match_summary(match_id)
         return map_raw_to_game_data(raw, game_name, self.static)
 
+    def get_historical_games(self, match_ids: Iterable[str], game_name: str, tag_line: str) -> Iterator[GameData]:
+        """
+        Yield GameData for each distinct match ID in completion order. Match payloads are
+        fetched concurrently in a bounded window; runes, spells and champion details are
+        resolved once for the whole batch. A match that fails to fetch or map is logged and
+        skipped so one bad ID does not abort a long backfill.
+        """
+        ids = iter(dict.fromkeys(match_ids))
+        tables = StaticTables(self.static)
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            pending = {pool.submit(self.riot.get_match_summary, mid): mid for mid in islice(ids, self.max_concurrency * 2)}
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        match_id = pending.pop(future)
+                        next_id = next(ids, None)
+                        if next_id is not None:
+                            pending[pool.submit(self.riot.get_match_summary, next_id)] = next_id
+                        try:
+                            game = map_raw_to_game_data(future.result(), game_name, self.static, tables)
+                        except Exception as e:
+                            logger.warning("Skipping match %s: %s: %s", match_id, type(e).__name__, e)
+                            continue
+                        yield game
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def get_recent_game_ids(self, game_name: str, tag_line: str, count: int = 10) -> list[str]:
         puuid = self.riot.get_puuid(game_name, tag_line)
         return self.riot.get_match_ids(puuid, count)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from core.models import GameData, ChampionData, RuneEntry, SummonerSpell
-from typing import Dict, List
+from core.models import GameData, ChampionData, RuneEntry, RuneIndex, SummonerSpell
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Tuple
 
 class GameDataInterface(ABC):
     @abstractmethod
@@ -9,9 +9,25 @@ class GameDataInterface(ABC):
     @abstractmethod
     def get_historical_game(self, match_id: str, game_name: str, tag_line: str) -> GameData: ...
 
+    @abstractmethod
+    def get_historical_games(self, match_ids: Iterable[str], game_name: str, tag_line: str) -> Iterator[GameData]: ...
+
     @abstractmethod
     def get_recent_game_ids(self, game_name: str, tag_line: str, count: int = 10) -> list[str]: ...
 
+class AsyncGameDataInterface(ABC):
+    @abstractmethod
+    async def get_live_game_info(self, game_name: str, tag_line: str) -> GameData: ...
+
+    @abstractmethod
+    async def get_historical_game(self, match_id: str, game_name: str, tag_line: str) -> GameData: ...
+
+    @abstractmethod
+    def get_historical_games(self, match_ids: Iterable[str], game_name: str, tag_line: str) -> AsyncIterator[GameData]: ...
+
+    @abstractmethod
+    async def get_recent_game_ids(self, game_name: str, tag_line: str, count: int = 10) -> list[str]: ...
+
 class RiotApiClientInterface(ABC):
     @abstractmethod
     def get_puuid(self, game_name: str, tag_line: str) -> str: ...
@@ -25,6 +41,31 @@ class RiotApiClientInterface(ABC):
     @abstractmethod
     def get_match_details(self, match_id: str) -> dict: ...
 
+    @abstractmethod
+    def get_match_summary(self, match_id: str) -> dict: ...
+
+class AsyncRiotApiClientInterface(ABC):
+    @abstractmethod
+    async def get_puuid(self, game_name: str, tag_line: str) -> str: ...
+
+    @abstractmethod
+    async def get_active_game(self, puuid: str) -> dict: ...
+
+    @abstractmethod
+    async def get_match_ids(self, puuid: str, count: int = 10) -> List[str]: ...
+
+    @abstractmethod
+    async def get_match_details(self, match_id: str) -> dict: ...
+
+    @abstractmethod
+    async def get_match_summary(self, match_id: str) -> dict: ...
+
+    @abstractmethod
+    async def get_many_match_details(self, match_ids: List[str]) -> Dict[str, dict]: ...
+
+    @abstractmethod
+    async def get_many_puuids(self, riot_ids: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]: ...
+
 class StaticDataProviderInterface(ABC):
     @abstractmethod
     def get_patch_version(self) -> str: ...
@@ -35,8 +76,17 @@ class StaticDataProviderInterface(ABC):
     @abstractmethod
     def get_champion_data(self, champion_name: str) -> ChampionData: ...
 
+    @abstractmethod
+    def get_champions_data(self, champion_names: Iterable[str]) -> Dict[str, ChampionData]: ...
+
     @abstractmethod
     def get_all_runes(self) -> Dict[str, RuneEntry]: ...
 
     @abstractmethod
-    def get_spell_data(self) -> Dict[str, SummonerSpell]: ...
\ No newline at end of file
+    def get_rune_index(self) -> RuneIndex: ...
+
+    @abstractmethod
+    def get_spell_data(self) -> Dict[str, SummonerSpell]: ...
+
+    @abstractmethod
+    def get_spell_data_by_id(self) -> Dict[int, SummonerSpell]: ...
\ No newline at end of file
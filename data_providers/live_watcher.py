@@ -0,0 +1,128 @@
+# live_watcher.py
+import heapq
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Iterable
+from data_providers.interfaces import RiotApiClientInterface
+from data_providers._internal.errors import NotFoundError, RiotAPIError
+
+logger = logging.getLogger(__name__)
+
+class LiveGameWatcher:
+    """
+    Polls spectator-v5 for many PUUIDs from one loop and calls on_game_start once per
+    (PUUID, game ID). Each account backs off exponentially while it is not in a game,
+    capped lower during active_hours (local hours when the watched players usually
+    queue) than outside them. Once a game is seen the account is only re-checked every
+    in_game_interval, and after the game ends polling restarts at min_interval since
+    players often queue again straight away. All calls go through the Riot client, so
+    its rate limiter still applies. Callbacks run on an executor (callback_workers
+    threads unless one is passed in), so a slow report never delays other accounts' polls.
+    """
+
+    def __init__(
+        self,
+        riot: RiotApiClientInterface,
+        on_game_start: Callable[[str, dict], None],
+        min_interval: float = 60.0,
+        max_interval: float = 900.0,
+        max_interval_active: float = 180.0,
+        in_game_interval: float = 600.0,
+        active_hours: Iterable[int] = (),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        local_hour: Callable[[], int] = lambda: datetime.now().hour,
+        executor: Executor | None = None,
+        callback_workers: int = 2,
+    ):
+        self.riot = riot
+        self.on_game_start = on_game_start
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_interval_active = max_interval_active
+        self.in_game_interval = in_game_interval
+        self.active_hours = set(active_hours)
+        self._clock = clock
+        self._sleep = sleep
+        self._local_hour = local_hour
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=callback_workers, thread_name_prefix="watch-callback")
+        self._schedule: list[tuple[float, str]] = []
+        self._intervals: dict[str, float] = {}
+        self._current_game: dict[str, str | None] = {}
+        self._seen: set[tuple[str, str]] = set()
+        self._seen_order: deque[tuple[str, str]] = deque()
+        self.polls = 0
+
+    def watch(self, puuids: Iterable[str]) -> None:
+        now = self._clock()
+        for puuid in puuids:
+            if puuid in self._intervals:
+                continue
+            self._intervals[puuid] = self.min_interval
+            self._current_game[puuid] = None
+            heapq.heappush(self._schedule, (now, puuid))
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the callback executor if the watcher created it; wait lets running callbacks finish."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    def unwatch(self, puuid: str) -> None:
+        self._intervals.pop(puuid, None)
+        self._current_game.pop(puuid, None)
+
+    def _idle_cap(self) -> float:
+        return self.max_interval_active if self._local_hour() in self.active_hours else self.max_interval
+
+    def _remember(self, key: tuple[str, str]) -> None:
+        self._seen.add(key)
+        self._seen_order.append(key)
+        if len(self._seen_order) > 10 * max(len(self._intervals), 1):
+            self._seen.discard(self._seen_order.popleft())
+
+    def poll(self, puuid: str) -> float:
+        """Check one account, dispatch the callback for a new game, and return the delay until its next check."""
+        self.polls += 1
+        try:
+            game = self.riot.get_active_game(puuid)
+        except NotFoundError:
+            if self._current_game.get(puuid) is not None:
+                self._current_game[puuid] = None
+                self._intervals[puuid] = self.min_interval
+            else:
+                self._intervals[puuid] = min(self._intervals[puuid] * 2, self._idle_cap())
+            return self._intervals[puuid]
+        except RiotAPIError:
+            self._intervals[puuid] = min(self._intervals[puuid] * 2, self.max_interval)
+            return self._intervals[puuid]
+
+        game_id = str(game.get("gameId"))
+        self._current_game[puuid] = game_id
+        if (puuid, game_id) not in self._seen:
+            self._remember((puuid, game_id))
+            self._executor.submit(self._notify, puuid, game)
+        return self.in_game_interval
+
+    def _notify(self, puuid: str, game: dict) -> None:
+        try:
+            self.on_game_start(puuid, game)
+        except Exception:
+            logger.exception("on_game_start failed for %s", puuid)
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False, max_polls: int | None = None) -> None:
+        while self._schedule and not should_stop():
+            if max_polls is not None and self.polls >= max_polls:
+                return
+            due, puuid = heapq.heappop(self._schedule)
+            if puuid not in self._intervals:
+                continue
+            wait = due - self._clock()
+            if wait > 0:
+                self._sleep(wait)
+            delay = self.poll(puuid)
+            if puuid in self._intervals:
+                heapq.heappush(self._schedule, (self._clock() + delay, puuid))
@@ -1,28 +1,135 @@
+import asyncio
 from data_providers.interfaces import RiotApiClientInterface
-from data_providers._internal.config import REGION, SERVER, get_headers
+from data_providers._internal.config import REGION, SERVER, HTTP_POOL_SIZE, APP_RATE_LIMIT, CACHE_DIR, PUUID_TTL, PUUID_REVALIDATE, get_headers
 from data_providers._internal.http_client import HttpClient
+from data_providers._internal.rate_limiter import RateLimiter
+from data_providers._internal.puuid_cache import PuuidCache
+from data_providers._internal.match_store import MatchStore
+from data_providers._internal.errors import NotFoundError, RiotAPIError
+from data_providers._internal.streaming import project_match, read_match_summary
+from data_providers._internal.single_flight import SingleFlight
+from data_providers._internal.async_http_client import AsyncHttpClient
+from data_providers.async_riot_client import AsyncRiotApiClient
 from urllib.parse import quote
 
 class RiotApiClient(RiotApiClientInterface):
-    def __init__(self):
-        self.http = HttpClient()
-        self.base_general = f"https://{SERVER}.api.riotgames.com"
-        self.base_regional = f"https://{REGION}.api.riotgames.com"
+    def __init__(self, http: HttpClient | None = None, puuid_cache: PuuidCache | None = None,
+                 match_store: MatchStore | None = None, base_general: str | None = None,
+                 base_regional: str | None = None,
+                 puuid_revalidate: float = PUUID_REVALIDATE):
+        self.http = http or HttpClient(pool_size=HTTP_POOL_SIZE, rate_limiter=RateLimiter(APP_RATE_LIMIT))
+        self.puuid_cache = puuid_cache or PuuidCache(CACHE_DIR / "puuids", PUUID_TTL)
+        self.match_store = match_store or MatchStore(CACHE_DIR / "matches")
+        self.base_general = base_general or f"https://{SERVER}.api.riotgames.com"
+        self.base_regional = base_regional or f"https://{REGION}.api.riotgames.com"
+        self.puuid_revalidate = puuid_revalidate
+        # PUUIDs served from the cache -> the Riot ID they were cached for, so a 404 on a call
+        # that used one can drop the stale mapping
+        self._puuid_owners: dict[str, tuple[str, str]] = {}
+        self._flights = SingleFlight()
 
     def get_puuid(self, game_name: str, tag_line: str) -> str:
+        # Riot IDs can be renamed, so cached mappings older than puuid_revalidate are re-checked
+        cached = self.puuid_cache.get(game_name, tag_line, max_age=self.puuid_revalidate)
+        if cached:
+            self._puuid_owners[cached] = (game_name, tag_line)
+            return cached
+        key = ("puuid", game_name.lower(), tag_line.lower())
+        return self._flights.do(key, lambda: self._fetch_puuid(game_name, tag_line))
+
+    def _fetch_puuid(self, game_name: str, tag_line: str) -> str:
         encoded_name = quote(game_name)
         encoded_tag = quote(tag_line)
         url = f"{self.base_regional}/riot/account/v1/accounts/by-riot-id/{encoded_name}/{encoded_tag}"
-        return self.http.get(url, headers=get_headers())["puuid"]
+        try:
+            puuid = self.http.get(url, headers=get_headers(), rate_limit_method="account-v1.by-riot-id")["puuid"]
+        except NotFoundError:
+            self.puuid_cache.invalidate(game_name, tag_line)
+            raise
+        except RiotAPIError:
+            # Revalidation failed for another reason; an unexpired mapping is still usable
+            stale = self.puuid_cache.get(game_name, tag_line)
+            if stale is None:
+                raise
+            return stale
+        self.puuid_cache.set(game_name, tag_line, puuid)
+        self._puuid_owners[puuid] = (game_name, tag_line)
+        return puuid
+
+    def invalidate_puuid(self, game_name: str, tag_line: str) -> None:
+        self.puuid_cache.invalidate(game_name, tag_line)
+
+    def _forget_puuid(self, puuid: str) -> None:
+        owner = self._puuid_owners.pop(puuid, None)
+        if owner is not None:
+            self.puuid_cache.invalidate(*owner)
 
     def get_active_game(self, puuid: str) -> dict:
         url = f"{self.base_general}/lol/spectator/v5/active-games/by-summoner/{puuid}"
-        return self.http.get(url, headers=get_headers())
+        return self._flights.do(
+            ("active-game", puuid),
+            lambda: self.http.get(url, headers=get_headers(), rate_limit_method="spectator-v5.active-games"),
+        )
 
     def get_match_ids(self, puuid: str, count: int = 10) -> list[str]:
         url = f"{self.base_regional}/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count={count}"
-        return self.http.get(url, headers=get_headers())
+        try:
+            return self.http.get(url, headers=get_headers(), rate_limit_method="match-v5.ids-by-puuid")
+        except NotFoundError:
+            # Unlike spectator-v5 (404 = not in game), a 404 here means the PUUID itself is unknown
+            self._forget_puuid(puuid)
+            raise
 
     def get_match_details(self, match_id: str) -> dict:
+        # Finished matches never change, so the local store is authoritative once populated
+        stored = self.match_store.get(match_id)
+        if stored is not None:
+            return stored
+        return self._flights.do(("match", match_id), lambda: self._fetch_match(match_id))
+
+    def _fetch_match(self, match_id: str) -> dict:
         url = f"{self.base_regional}/lol/match/v5/matches/{match_id}"
-        return self.http.get(url, headers=get_headers())
\ No newline at end of file
+        payload = self.http.get(url, headers=get_headers(), rate_limit_method="match-v5.match")
+        self.match_store.put(match_id, payload)
+        return payload
+
+    def get_match_summary(self, match_id: str) -> dict:
+        """Participants, perks and stats only, decoded incrementally from the stored payload."""
+        stream = self.match_store.open(match_id)
+        if stream is None:
+            self._flights.do(("match-stream", match_id), lambda: self._store_match(match_id))
+            stream = self.match_store.open(match_id)
+        if stream is None:
+            # The stored object vanished in between (e.g. another process pruned it)
+            return project_match(self._fetch_match(match_id))
+        with stream:
+            return read_match_summary(stream)
+
+    def _store_match(self, match_id: str) -> None:
+        if self.match_store.has(match_id):
+            return
+        url = f"{self.base_regional}/lol/match/v5/matches/{match_id}"
+        with self.http.get_stream(url, headers=get_headers(), rate_limit_method="match-v5.match") as body:
+            self.match_store.put_stream(match_id, body)
+
+    def _run_async(self, call, max_concurrency: int):
+        async def runner():
+            client = AsyncRiotApiClient(
+                http=AsyncHttpClient(pool_size=self.http.pool_size, rate_limiter=self.http.rate_limiter),
+                max_concurrency=max_concurrency,
+                puuid_cache=self.puuid_cache,
+                match_store=self.match_store,
+                puuid_revalidate=self.puuid_revalidate,
+            )
+            try:
+                return await call(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(runner())
+
+    def get_many_match_details(self, match_ids: list[str], max_concurrency: int = 10) -> dict[str, dict]:
+        return self._run_async(lambda client: client.get_many_match_details(match_ids), max_concurrency)
+
+    def get_many_puuids(self, riot_ids: list[tuple[str, str]], max_concurrency: int = 10) -> dict[tuple[str, str], str]:
+        return self._run_async(lambda client: client.get_many_puuids(riot_ids), max_concurrency)
@@ -1,142 +1,218 @@
 # static_data.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 from data_providers.interfaces import StaticDataProviderInterface
-from data_providers._internal.config import get_headers, get_cdn_url
+from data_providers._internal.config import get_cdn_url, CACHE_DIR, CACHE_MAX_BYTES, HTTP_POOL_SIZE, VERSION_TTL
 from data_providers._internal.http_client import HttpClient
-from data_providers._internal.cache import CDNCache
-from data_providers._internal.version_tracker import VersionTracker
+from data_providers._internal.cache import CDNCache, DiskCache
+from data_providers._internal.version_source import PatchVersionSource
 from data_providers._internal.errors import StaticDataNotFound
-from core.models import ChampionData, RuneEntry, SummonerSpell
+from data_providers._internal.single_flight import SingleFlight
+from data_providers._internal.streaming import iter_champion_entries
+from data_providers._internal.ddragon import (
+    parse_champion, parse_champions_json, parse_runes_json, parse_rune_index_json, parse_spells_json, parse_spells_by_id_json,
+)
+from core.models import ChampionData, ChampionTable, RuneEntry, RuneIndex, SummonerSpell
 
 class StaticDataProvider(StaticDataProviderInterface):
-    def __init__(self, lang="en_US"):
+    """
+    Data Dragon tables for the current patch. Only the very first load happens on the
+    request path: when a newer patch is announced later, its tables are built on a
+    background thread while requests keep being answered from the patch already loaded,
+    and the (version, tables) pair is swapped in at once when the build finishes.
+    """
+
+    def __init__(self, lang="en_US", disk_cache: DiskCache | None = None, http: HttpClient | None = None,
+                 version_source: PatchVersionSource | None = None, refresh_retry: float = 60.0, clock=time.monotonic):
         self.lang = lang
-        self.http = HttpClient()
+        self.http = http or HttpClient(pool_size=HTTP_POOL_SIZE)
         self.cache = CDNCache()
-        self.version_tracker = VersionTracker()
+        self.disk_cache = disk_cache or DiskCache(CACHE_DIR / "ddragon", CACHE_MAX_BYTES)
+        self.version_source = version_source or PatchVersionSource(self.http, CACHE_DIR / "versions.state.json", VERSION_TTL)
+        self.refresh_retry = refresh_retry
+        self._clock = clock
         self._version = None
+        # Concurrent reports share one fetch/parse per key instead of racing each other
+        self._flights = SingleFlight()
+        self._swap_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_failed: tuple[str, float] | None = None
 
     def get_patch_version(self) -> str:
-        if self._version:
-            return self._version
-        url = "https://ddragon.leagueoflegends.com/api/versions.json"
-        versions = self.http.get(url)
-        self._version = versions[0]
+        """The patch the served tables belong to; may trail the latest one while a refresh runs."""
+        self._ensure_cache_valid()
         return self._version
 
+    def _current(self) -> tuple[str, CDNCache]:
+        with self._swap_lock:
+            return self._version, self.cache
+
     def _ensure_cache_valid(self):
-        version = self.get_patch_version()
-        if self.version_tracker.has_changed(version):
-            self.cache.invalidate_all()
-            self.version_tracker.set_version(version)
+        latest = self.version_source.latest()
+        if latest == self._version:
+            return
+        with self._swap_lock:
+            if self._version is None:
+                # Cold start: nothing older to serve, so the tables load on demand
+                self._version = latest
+                return
+            if latest == self._version or (self._refresh_thread and self._refresh_thread.is_alive()):
+                return
+            if self._refresh_failed and self._refresh_failed[0] == latest \
+                    and self._clock() - self._refresh_failed[1] < self.refresh_retry:
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh, args=(latest, self.cache), name=f"ddragon-refresh-{latest}", daemon=True
+            )
+            self._refresh_thread.start()
 
-    def get_all_champions(self) -> dict[str, ChampionData]:
-        self._ensure_cache_valid()
-        cache_key = "champion_list"
-        cached = self.cache.get(cache_key)
+    def wait_for_refresh(self, timeout: float | None = None) -> None:
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh(self, version: str, previous: CDNCache) -> None:
+        try:
+            cache = self._build_tables(version, previous)
+        except Exception:
+            # Keep serving the previous patch and retry after refresh_retry seconds
+            with self._swap_lock:
+                self._refresh_failed = (version, self._clock())
+            return
+        with self._swap_lock:
+            old_version = self._version
+            self._version, self.cache = version, cache
+            self._refresh_failed = None
+        # New games intern into the new patch's table; entries already mapped keep the old one alive
+        ChampionTable.release(old_version)
+
+    def _build_tables(self, version: str, previous: CDNCache) -> CDNCache:
+        """Load, for the new version and into a fresh cache, every table the previous patch had in memory."""
+        cache = CDNCache()
+        self._cached(version, cache, "champion_list", self._load_champion_list)
+        self._cached(version, cache, "runes", self._load_runes)
+        self._cached(version, cache, "rune_index", self._load_rune_index)
+        self._cached(version, cache, "spells", self._load_spells)
+        self._cached(version, cache, "spells_by_id", self._load_spells_by_id)
+
+        # championFull.json carries every champion's stats and spells in one download, so it
+        # shows which loaded champions changed; only those detail files are refetched and the
+        # rest are carried over from the previous patch
+        loaded = {key[len("champion_detail_"):]: previous.get(key) for key in previous.keys() if key.startswith("champion_detail_")}
+        if loaded:
+            full = self._load_champion_full(version)
+            changed = []
+            for name, old in loaded.items():
+                if old is not None and full.get(name) == old:
+                    cache.set(f"champion_detail_{name}", old)
+                else:
+                    changed.append(name)
+            self._load_champions(version, cache, changed)
+        return cache
+
+    def _open_cdn(self, version: str, endpoint: str):
+        # Bodies are streamed straight to the disk cache and always read back from there
+        stream = self.disk_cache.open(version, self.lang, endpoint)
+        if stream is None:
+            self._flights.do(("cdn", version, endpoint), lambda: self._download(version, endpoint))
+            stream = self.disk_cache.open(version, self.lang, endpoint)
+        if stream is None:
+            raise StaticDataNotFound(f"{endpoint} for {version} vanished from the disk cache")
+        return stream
+
+    def _download(self, version: str, endpoint: str) -> None:
+        existing = self.disk_cache.open(version, self.lang, endpoint)
+        if existing is not None:
+            existing.close()
+            return
+        with self.http.get_stream(get_cdn_url(version, self.lang, endpoint)) as body:
+            self.disk_cache.set_stream(version, self.lang, endpoint, body)
+
+    def _get_cdn_bytes(self, version: str, endpoint: str) -> bytes:
+        # Smaller payloads go to the precompiled validators as bytes, never through json.loads
+        with self._open_cdn(version, endpoint) as stream:
+            return stream.read()
+
+    def _cached(self, version: str, cache: CDNCache, cache_key: str, load):
+        cached = cache.get(cache_key)
         if cached:
             return cached
-        url = get_cdn_url(self._version, self.lang, "champion.json")
-        raw = self.http.get(url)
-        parsed = {}
-        for champ in raw["data"].values():
-            parsed[champ["id"]] = ChampionData(
-                name=champ["id"],
-                base_hp=champ["stats"]["hp"],
-                base_hp_regen=champ["stats"]["hpregen"],
-                base_mp=champ["stats"]["mp"],
-                base_mp_regen=champ["stats"]["mpregen"],
-                base_armor=champ["stats"]["armor"],
-                base_mr=champ["stats"]["spellblock"],
-                base_ad=champ["stats"]["attackdamage"],
-                base_as=champ["stats"]["attackspeed"],
-                base_movespeed=champ["stats"]["movespeed"],
-                base_range=champ["stats"]["attackrange"],
-                hp_per_level=champ["stats"]["hpperlevel"],
-                mp_per_level=champ["stats"]["mpperlevel"],
-                armor_per_level=champ["stats"]["armorperlevel"],
-                mr_per_level=champ["stats"]["spellblockperlevel"],
-                ad_per_level=champ["stats"]["attackdamageperlevel"],
-                as_per_level=champ["stats"]["attackspeedperlevel"],
-                q_cooldowns=[],
-                w_cooldowns=[],
-                e_cooldowns=[],
-                r_cooldowns=[],
-            )
-        self.cache.set(cache_key, parsed)
-        return parsed
 
-    def get_champion_data(self, champion_name: str) -> ChampionData:
+        def fill():
+            # A caller that just finished the same load may have filled the cache already
+            cached = cache.get(cache_key)
+            if cached:
+                return cached
+            value = load(version)
+            cache.set(cache_key, value)
+            return value
+
+        return self._flights.do((version, cache_key), fill)
+
+    def _get(self, cache_key: str, load):
         self._ensure_cache_valid()
-        cache_key = f"champion_detail_{champion_name}"
-        cached = self.cache.get(cache_key)
-        if cached:
-            return cached
+        version, cache = self._current()
+        return self._cached(version, cache, cache_key, load)
 
-        url = get_cdn_url(self._version, self.lang, f"champion/{champion_name}.json")
-        raw = self.http.get(url)
-        data = raw["data"][champion_name]
-        stats = data["stats"]
-        spells = data["spells"]
-
-        champ = ChampionData(
-            name=champion_name,
-            base_hp=stats["hp"],
-            base_hp_regen=stats["hpregen"],
-            base_mp=stats["mp"],
-            base_mp_regen=stats["mpregen"],
-            base_armor=stats["armor"],
-            base_mr=stats["spellblock"],
-            base_ad=stats["attackdamage"],
-            base_as=stats["attackspeed"],
-            base_movespeed=stats["movespeed"],
-            base_range=stats["attackrange"],
-            hp_per_level=stats["hpperlevel"],
-            mp_per_level=stats["mpperlevel"],
-            armor_per_level=stats["armorperlevel"],
-            mr_per_level=stats["spellblockperlevel"],
-            ad_per_level=stats["attackdamageperlevel"],
-            as_per_level=stats["attackspeedperlevel"],
-            q_cooldowns=spells[0]["cooldown"],
-            w_cooldowns=spells[1]["cooldown"],
-            e_cooldowns=spells[2]["cooldown"],
-            r_cooldowns=spells[3]["cooldown"],
-        )
-        self.cache.set(cache_key, champ)
-        return champ
+    def _stream_champions(self, version: str, endpoint: str) -> dict[str, ChampionData]:
+        # The all-champion files are decoded one entry at a time, so only a single champion's
+        # lore, skins and tooltips are ever held as Python objects
+        with self._open_cdn(version, endpoint) as stream:
+            return {champ_id: parse_champion(entry, champ_id) for champ_id, entry in iter_champion_entries(stream)}
 
-    def get_all_runes(self) -> dict[str, RuneEntry]:
+    def _load_champion_list(self, version: str) -> dict[str, ChampionData]:
+        return self._stream_champions(version, "champion.json")
+
+    def _load_champion_full(self, version: str) -> dict[str, ChampionData]:
+        return self._stream_champions(version, "championFull.json")
+
+    def _load_champion(self, version: str, champion_name: str) -> ChampionData:
+        return parse_champions_json(self._get_cdn_bytes(version, f"champion/{champion_name}.json"))[champion_name]
+
+    def _load_champions(self, version: str, cache: CDNCache, names: list[str]) -> dict[str, ChampionData]:
+        def load(name: str) -> ChampionData:
+            return self._cached(version, cache, f"champion_detail_{name}", lambda v: self._load_champion(v, name))
+
+        missing = [name for name in names if not cache.get(f"champion_detail_{name}")]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(missing), self.http.pool_size)) as pool:
+                list(pool.map(load, missing))
+        return {name: load(name) for name in names}
+
+    def _load_runes(self, version: str) -> dict[str, RuneEntry]:
+        return parse_runes_json(self._get_cdn_bytes(version, "runesReforged.json"))
+
+    def _load_rune_index(self, version: str) -> RuneIndex:
+        return parse_rune_index_json(self._get_cdn_bytes(version, "runesReforged.json"))
+
+    def _load_spells(self, version: str) -> dict[str, SummonerSpell]:
+        return parse_spells_json(self._get_cdn_bytes(version, "summoner.json"))
+
+    def _load_spells_by_id(self, version: str) -> dict[int, SummonerSpell]:
+        return parse_spells_by_id_json(self._get_cdn_bytes(version, "summoner.json"))
+
+    def get_all_champions(self) -> dict[str, ChampionData]:
+        return self._get("champion_list", self._load_champion_list)
+
+    def get_champion_data(self, champion_name: str) -> ChampionData:
+        return self._get(f"champion_detail_{champion_name}", lambda version: self._load_champion(version, champion_name))
+
+    def get_champions_data(self, champion_names: Iterable[str]) -> dict[str, ChampionData]:
+        """Resolve several champions at once, fetching the uncached details concurrently."""
         self._ensure_cache_valid()
-        cache_key = "runes"
-        cached = self.cache.get(cache_key)
-        if cached:
-            return cached
-        url = get_cdn_url(self._version, self.lang, "runesReforged.json")
-        raw = self.http.get(url)
-        parsed = {}
-        for tree in raw:
-            for slot in tree.get("slots", []):
-                for rune in slot.get("runes", []):
-                    parsed[rune["name"]] = RuneEntry(
-                        name=rune["name"],
-                        shortDesc=rune.get("shortDesc", "")
-                    )
-        self.cache.set(cache_key, parsed)
-        return parsed
+        version, cache = self._current()
+        return self._load_champions(version, cache, list(dict.fromkeys(champion_names)))
+
+    def get_all_runes(self) -> dict[str, RuneEntry]:
+        return self._get("runes", self._load_runes)
+
+    def get_rune_index(self) -> RuneIndex:
+        return self._get("rune_index", self._load_rune_index)
 
     def get_spell_data(self) -> dict[str, SummonerSpell]:
-        self._ensure_cache_valid()
-        cache_key = "spells"
-        cached = self.cache.get(cache_key)
-        if cached:
-            return cached
-        url = get_cdn_url(self._version, self.lang, "summoner.json")
-        raw = self.http.get(url)
-        parsed = {}
-        for spell in raw["data"].values():
-            parsed[spell["name"]] = SummonerSpell(
-                name=spell["name"],
-                cooldown=[float(cd) for cd in ([spell["cooldown"]] if isinstance(spell["cooldown"], (int, float)) else spell["cooldown"])],
-                description=spell.get("description", "")
-            )
-        self.cache.set(cache_key, parsed)
-        return parsed
+        return self._get("spells", self._load_spells)
+
+    def get_spell_data_by_id(self) -> dict[int, SummonerSpell]:
+        return self._get("spells_by_id", self._load_spells_by_id)
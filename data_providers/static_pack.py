@@ -0,0 +1,204 @@
+# static_pack.py
+"""
+Offline static data pack: a single indexed file built from a Data Dragon snapshot.
+
+Layout: MAGIC | u32 header length | header JSON | records. The header maps every
+champion (and the rune and spell tables) to an (offset, length) span of compact JSON
+in the record area, so the provider can mmap the file and decode one champion at a
+time on first use.
+
+Build from a snapshot directory laid out like Data Dragon's data/<lang>/ folder
+(champion.json, champion/<Name>.json, runesReforged.json, summoner.json). runesReforged.json
+and summoner.json are required; champions without a detail file are packed without
+cooldowns and listed under "missing_details" in the header.
+
+    python -m data_providers.static_pack build <snapshot_dir> <out_file>
+"""
+import json
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterable
+from data_providers.interfaces import StaticDataProviderInterface
+from data_providers._internal.cache import atomic_write_bytes, _version_sort_key
+from data_providers._internal.ddragon import (
+    parse_champion_json, parse_runes_json, parse_rune_index_json, parse_spells_json, parse_spells_by_id_json,
+)
+from data_providers._internal.errors import StaticDataNotFound
+from core.models import ChampionData, RuneEntry, RuneIndex, SummonerSpell
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"LOLCHPK1"
+_HEADER_LEN = struct.Struct("<I")
+_DATA_START = len(MAGIC) + _HEADER_LEN.size
+
+def _load_json(path: Path):
+    payload = path.read_bytes()
+    try:
+        return json.loads(payload.decode("utf-8"))
+    except UnicodeDecodeError:
+        # Some Data Dragon dumps were re-saved with a Windows code page
+        return json.loads(payload.decode("cp1252"))
+
+def _compact(value) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def _project_champion(entry: dict) -> dict:
+    projected = {"id": entry["id"], "key": entry.get("key"), "stats": entry["stats"]}
+    if entry.get("spells"):
+        projected["spells"] = [{"id": spell.get("id"), "cooldown": spell["cooldown"]} for spell in entry["spells"]]
+    return projected
+
+def _project_runes(raw: list) -> list:
+    return [
+        {
+            "id": tree["id"],
+            "key": tree.get("key"),
+            "name": tree["name"],
+            "slots": [
+                {"runes": [{"id": r["id"], "key": r.get("key"), "name": r["name"], "shortDesc": r.get("shortDesc", "")} for r in slot.get("runes", [])]}
+                for slot in tree.get("slots", [])
+            ],
+        }
+        for tree in raw
+    ]
+
+def _project_spells(raw: dict) -> dict:
+    return {
+        "data": {
+            spell_id: {k: spell.get(k) for k in ("id", "key", "name", "cooldown", "description")}
+            for spell_id, spell in raw["data"].items()
+        }
+    }
+
+def build_static_pack(source_dir: Path, out_path: Path, lang: str = "en_US") -> Path:
+    source_dir = Path(source_dir)
+    summary_path = source_dir / "champion.json"
+    if not summary_path.exists():
+        # Versioned dumps (champion_9.24.1.json, champion_15.12.1.json, ...) sort numerically
+        candidates = sorted(source_dir.glob("champion_*.json"), key=lambda p: _version_sort_key(p.stem[len("champion_"):]))
+        if not candidates:
+            raise StaticDataNotFound(f"No champion.json found in {source_dir}")
+        summary_path = candidates[-1]
+    runes_path = source_dir / "runesReforged.json"
+    spells_path = source_dir / "summoner.json"
+    for path in (runes_path, spells_path):
+        if not path.exists():
+            # A pack without them would serve empty runes and spells without any error
+            raise StaticDataNotFound(f"No {path.name} found in {source_dir}")
+    summary = _load_json(summary_path)
+
+    records = bytearray()
+    header = {"version": summary.get("version"), "lang": lang, "champions": {}, "missing_details": []}
+
+    def add(value) -> list[int]:
+        blob = _compact(value)
+        span = [len(records), len(blob)]
+        records.extend(blob)
+        return span
+
+    for champ_id, entry in sorted(summary["data"].items()):
+        detail_path = source_dir / "champion" / f"{champ_id}.json"
+        if detail_path.exists():
+            entry = _load_json(detail_path)["data"][champ_id]
+        else:
+            header["missing_details"].append(champ_id)
+        header["champions"][champ_id] = add(_project_champion(entry))
+    if header["missing_details"]:
+        logger.warning("No champion/<Name>.json for %d champions, packed without cooldowns: %s",
+                       len(header["missing_details"]), ", ".join(header["missing_details"]))
+
+    header["runes"] = add(_project_runes(_load_json(runes_path)))
+    header["spells"] = add(_project_spells(_load_json(spells_path)))
+
+    header_blob = _compact(header)
+    atomic_write_bytes(Path(out_path), MAGIC + _HEADER_LEN.pack(len(header_blob)) + header_blob + bytes(records))
+    return Path(out_path)
+
+class StaticPackProvider(StaticDataProviderInterface):
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise StaticDataNotFound(f"{self.path} is not a static data pack")
+        (header_len,) = _HEADER_LEN.unpack_from(self._mm, len(MAGIC))
+        self._header = json.loads(self._mm[_DATA_START:_DATA_START + header_len])
+        self._base = _DATA_START + header_len
+        self._champions: dict[str, ChampionData] = {}
+        self._runes = None
+        self._rune_index = None
+        self._spells = None
+        self._spells_by_id = None
+
+    def close(self):
+        self._mm.close()
+
+    def _record(self, span) -> bytes:
+        # Records stay JSON bytes; the ddragon validators decode them without json.loads
+        offset, length = span
+        start = self._base + offset
+        return self._mm[start:start + length]
+
+    def get_patch_version(self) -> str:
+        return self._header["version"]
+
+    @property
+    def missing_details(self) -> list[str]:
+        """Champions packed from champion.json alone, i.e. without ability cooldowns."""
+        return self._header.get("missing_details", [])
+
+    def get_all_champions(self) -> dict[str, ChampionData]:
+        return self.get_champions_data(self._header["champions"])
+
+    def get_champion_data(self, champion_name: str) -> ChampionData:
+        champ = self._champions.get(champion_name)
+        if champ is None:
+            span = self._header["champions"].get(champion_name)
+            if span is None:
+                raise StaticDataNotFound(f"Champion {champion_name} not in static pack {self.path}")
+            champ = parse_champion_json(self._record(span), champion_name)
+            self._champions[champion_name] = champ
+        return champ
+
+    def get_champions_data(self, champion_names: Iterable[str]) -> dict[str, ChampionData]:
+        return {name: self.get_champion_data(name) for name in dict.fromkeys(champion_names)}
+
+    def get_all_runes(self) -> dict[str, RuneEntry]:
+        if self._runes is None:
+            self._runes = parse_runes_json(self._record(self._header["runes"]))
+        return self._runes
+
+    def get_rune_index(self) -> RuneIndex:
+        if self._rune_index is None:
+            self._rune_index = parse_rune_index_json(self._record(self._header["runes"]))
+        return self._rune_index
+
+    def get_spell_data(self) -> dict[str, SummonerSpell]:
+        if self._spells is None:
+            self._spells = parse_spells_json(self._record(self._header["spells"]))
+        return self._spells
+
+    def get_spell_data_by_id(self) -> dict[int, SummonerSpell]:
+        if self._spells_by_id is None:
+            self._spells_by_id = parse_spells_by_id_json(self._record(self._header["spells"]))
+        return self._spells_by_id
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build an offline static data pack from a Data Dragon snapshot.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Ingest a snapshot directory into a pack file")
+    build.add_argument("source", type=Path, help="Directory with champion.json, champion/, runesReforged.json, summoner.json")
+    build.add_argument("out", type=Path, help="Output pack file")
+    build.add_argument("--lang", default="en_US")
+    args = parser.parse_args()
+
+    out = build_static_pack(args.source, args.out, args.lang)
+    provider = StaticPackProvider(out)
+    print(f"✅ Static pack {provider.get_patch_version()} with {len(provider.get_all_champions())} champions saved to {out}")
+    if provider.missing_details:
+        print(f"⚠️ No cooldowns for {len(provider.missing_details)} champions without a detail file: {', '.join(provider.missing_details)}")
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Tuple
+from pydantic import TypeAdapter, ValidationError
+from core.models import GameData, PlayerGameEntry, Comparison, Strength, LaningDimension, JungleDimension, LaneMatchupReport
+from data_providers._internal.cache import atomic_write_bytes
+from llm_analysis.interfaces import LLMAnalyzerInterface
+from llm_analysis.parsing.parser import LEVEL_ENTRY, LANE_STYLE_ENTRY, JUNGLE_ENTRY
+
+_SPIKES = TypeAdapter(LaneMatchupReport.model_fields["extra_spikes"].annotation)
+_TIP = TypeAdapter(str)
+
+def matchup_key(champion: str, opponent: str, role: str, patch: str) -> str:
+    """Normalised (champion, opponent, role, patch) key; champion names are case-insensitive."""
+    return "|".join((champion.strip().lower(), opponent.strip().lower(), role.strip().upper(), patch.strip()))
+
+class MatchupCache:
+    """
+    Persistent LLM results per matchup, one small JSON file per (matchup, item) laid out as
+    <root>/<patch>/<key hash>/<item>.json so concurrent writers never merge files. The patch
+    is part of the key, so a new patch simply stops hitting old entries. Once the total size
+    exceeds max_bytes, entries are evicted down to low_water * max_bytes, so the tree is only
+    rescanned every so often; entries from other patches go first, then the least recently
+    used ones (reads bump the file's mtime).
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 64 * 1024 * 1024, low_water: float = 0.8, clock=time.time):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._clock = clock
+        self._size: int | None = None
+        self._latest_patch: str | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str, item: str) -> Path:
+        patch = key.rsplit("|", 1)[-1]
+        if not patch:
+            # Without a patch nothing would ever invalidate the entry
+            raise ValueError(f"Matchup key {key!r} has no patch")
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        name = hashlib.sha1(item.encode("utf-8")).hexdigest()[:16]
+        return self.root / patch / digest / f"{name}.json"
+
+    def _touch(self, path: Path) -> None:
+        now = self._clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def get(self, key: str, item: str) -> Any | None:
+        path = self._path(key, item)
+        try:
+            entry = json.loads(path.read_bytes())
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            return None
+        if entry.get("key") != key or entry.get("item") != item:
+            return None
+        self._touch(path)
+        return entry.get("value")
+
+    def set(self, key: str, item: str, value: Any) -> None:
+        payload = json.dumps({"key": key, "item": item, "value": value, "stored_at": self._clock()}).encode("utf-8")
+        path = self._path(key, item)
+        try:
+            replaced = path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            replaced = 0
+        atomic_write_bytes(path, payload)
+        self._touch(path)
+        with self._lock:
+            self._latest_patch = path.parent.parent.name
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(payload) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[Path, int, float]]:
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".json"):
+                    continue
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        entries.sort(key=lambda e: (e[0].parent.parent.name == self._latest_patch, e[2]))
+        target = self.max_bytes * self.low_water
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+        self._size = total
+
+class CachedLLMAnalyzer(LLMAnalyzerInterface):
+    """
+    Serves lane and jungle results from a MatchupCache and only asks the wrapped analyzer
+    for items it has not seen for this (champion, opponent, role, patch). Threat analyses
+    depend on all ten champions and are passed through.
+    """
+
+    def __init__(self, inner: LLMAnalyzerInterface, cache: MatchupCache):
+        self.inner = inner
+        self.cache = cache
+
+    def _lane_key(self, game_data: GameData) -> str | None:
+        user = game_data.get_user_entry()
+        opponent = game_data.get_lane_opponent_entry()
+        return self._key(user, opponent, user.role, game_data)
+
+    def _jungle_key(self, game_data: GameData) -> str | None:
+        ally = game_data.get_player("JUNGLE", "ALLY")
+        enemy = game_data.get_player("JUNGLE", "ENEMY")
+        return self._key(ally, enemy, "JUNGLE", game_data)
+
+    @staticmethod
+    def _key(champion: PlayerGameEntry, opponent: PlayerGameEntry, role: str, game_data: GameData) -> str | None:
+        # Games built by hand may only carry the patch on their entries; with none at all the
+        # results could never be invalidated, so they are not cached
+        patch = game_data.patch_version or champion.patch
+        if not patch:
+            return None
+        return matchup_key(champion.champion.name, opponent.champion.name, role, patch)
+
+    def _lookup(self, key: str, item: str, adapter: TypeAdapter) -> Any | None:
+        value = self.cache.get(key, item)
+        if value is None:
+            return None
+        try:
+            return adapter.validate_python(value)
+        except ValidationError:
+            return None
+
+    def _store(self, key: str, item: str, adapter: TypeAdapter, value: Any) -> None:
+        self.cache.set(key, item, adapter.dump_python(value, mode="json"))
+
+    def _one(self, key: str | None, item: str, adapter: TypeAdapter, fetch: Callable[[], Any]) -> Any:
+        if key is None:
+            return fetch()
+        value = self._lookup(key, item, adapter)
+        if value is None:
+            value = fetch()
+            self._store(key, item, adapter, value)
+        return value
+
+    def _many(self, key: str | None, prefix: str, items: Iterable, adapter: TypeAdapter, fetch: Callable[[list], dict]) -> dict:
+        items = list(items)
+        if key is None:
+            return fetch(items)
+        found = {item: self._lookup(key, f"{prefix}{item}", adapter) for item in items}
+        missing = [item for item in items if found[item] is None]
+        if missing:
+            for item, value in fetch(missing).items():
+                found[item] = value
+                self._store(key, f"{prefix}{item}", adapter, value)
+        return {item: found[item] for item in items if found[item] is not None}
+
+    def batches(self, method: str) -> bool:
+        # Batch only when the wrapped analyzer does; otherwise per-item calls (each cached) fan out
+        return self.inner.batches(method)
+
+    def start_context_window(self) -> None:
+        self.inner.start_context_window()
+
+    def end_context_window(self) -> None:
+        self.inner.end_context_window()
+
+    def get_lane_power_level(self, game_data: GameData, level: int) -> Tuple[Comparison, str]:
+        return self._one(self._lane_key(game_data), f"level:{level}", LEVEL_ENTRY,
+                         lambda: self.inner.get_lane_power_level(game_data, level))
+
+    def get_lane_power_levels(self, game_data: GameData, levels: Iterable[int]) -> Dict[int, Tuple[Comparison, str]]:
+        return self._many(self._lane_key(game_data), "level:", levels, LEVEL_ENTRY,
+                          lambda missing: self.inner.get_lane_power_levels(game_data, missing))
+
+    def get_lane_extra_spikes(self, game_data: GameData) -> Dict[int, Tuple[Comparison, str]]:
+        return self._one(self._lane_key(game_data), "spikes", _SPIKES,
+                         lambda: self.inner.get_lane_extra_spikes(game_data))
+
+    def get_lane_style_entry(self, game_data: GameData, dimension: LaningDimension) -> Tuple[Strength, Strength, str]:
+        return self._one(self._lane_key(game_data), f"style:{dimension}", LANE_STYLE_ENTRY,
+                         lambda: self.inner.get_lane_style_entry(game_data, dimension))
+
+    def get_lane_style_entries(self, game_data: GameData, dimensions: Iterable[LaningDimension]) -> Dict[LaningDimension, Tuple[Strength, Strength, str]]:
+        return self._many(self._lane_key(game_data), "style:", dimensions, LANE_STYLE_ENTRY,
+                          lambda missing: self.inner.get_lane_style_entries(game_data, missing))
+
+    def get_jungle_dimension_entry(self, game_data: GameData, dimension: JungleDimension) -> Tuple[Strength, Strength, str]:
+        return self._one(self._jungle_key(game_data), f"jungle:{dimension}", JUNGLE_ENTRY,
+                         lambda: self.inner.get_jungle_dimension_entry(game_data, dimension))
+
+    def get_jungle_dimension_entries(self, game_data: GameData, dimensions: Iterable[JungleDimension]) -> Dict[JungleDimension, Tuple[Strength, Strength, str]]:
+        return self._many(self._jungle_key(game_data), "jungle:", dimensions, JUNGLE_ENTRY,
+                          lambda missing: self.inner.get_jungle_dimension_entries(game_data, missing))
+
+    def get_cooldowns_leverage_suggestion(self, game_data: GameData) -> str:
+        return self._one(self._lane_key(game_data), "cooldowns", _TIP,
+                         lambda: self.inner.get_cooldowns_leverage_suggestion(game_data))
+
+    def get_teamfight_threats(self, game_data: GameData) -> Dict[str, str]:
+        return self.inner.get_teamfight_threats(game_data)
+
+    def get_sidelane_threats(self, game_data: GameData) -> Dict[str, str]:
+        return self.inner.get_sidelane_threats(game_data)
@@ -1,4 +1,4 @@
-from typing import Tuple, Dict
+from typing import Iterable, Tuple, Dict
 from llm_analysis.interfaces import LLMAnalyzerInterface
 from core.models import (
     GameData,
@@ -14,7 +14,11 @@ from llm_analysis.parsing.parser import (
     parse_comparison_output,
     parse_strength_output,
     parse_threat_output,
-    parse_cooldown_tip
+    parse_cooldown_tip,
+    parse_batch_entries,
+    LEVEL_ENTRY,
+    LANE_STYLE_ENTRY,
+    JUNGLE_ENTRY,
 )
 
 class GPTLLMAnalyzer(LLMAnalyzerInterface):
@@ -29,6 +33,21 @@ class GPTLLMAnalyzer(LLMAnalyzerInterface):
     def end_context_window(self) -> None:
         self.context.clear()
 
+    def get_lane_power_levels(self, game_data: GameData, levels: Iterable[int]) -> Dict[int, Tuple[Comparison, str]]:
+        levels = list(levels)
+        prompt = self.prompter.build_lane_power_batch_prompt(game_data, levels)
+        return parse_batch_entries(self.llm.call(prompt), levels, LEVEL_ENTRY)
+
+    def get_lane_style_entries(self, game_data: GameData, dimensions: Iterable[LaningDimension]) -> Dict[LaningDimension, Tuple[Strength, Strength, str]]:
+        dimensions = list(dimensions)
+        prompt = self.prompter.build_lane_style_batch_prompt(game_data, dimensions)
+        return parse_batch_entries(self.llm.call(prompt), dimensions, LANE_STYLE_ENTRY)
+
+    def get_jungle_dimension_entries(self, game_data: GameData, dimensions: Iterable[JungleDimension]) -> Dict[JungleDimension, Tuple[Strength, Strength, str]]:
+        dimensions = list(dimensions)
+        prompt = self.prompter.build_jungle_batch_prompt(game_data, dimensions)
+        return parse_batch_entries(self.llm.call(prompt), dimensions, JUNGLE_ENTRY)
+
     def get_lane_power_level(self, game_data: GameData, level: int) -> Tuple[Comparison, str]:
         prompt = self.prompter.build_lane_power_prompt(game_data, level)
         response = self.llm.call(prompt)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Tuple
 from core.models.game_data import GameData
 from core.models.literals import Comparison, JungleDimension, LaningDimension, Strength
 
@@ -28,6 +28,35 @@ class LLMAnalyzerInterface(ABC):
         Return (ally strength, enemy strength, comment) for the given jungle dimension.
         """
 
+    # Batched variants. The defaults make one call per item; implementations that can answer
+    # several items in one request override them. Items that could not be produced are left
+    # out of the returned mapping rather than failing the whole batch.
+
+    def batches(self, method: str) -> bool:
+        """
+        Whether the named batched method answers several items per request. Callers that can
+        run per-item calls concurrently should only prefer the batched method when it does.
+        """
+        return getattr(type(self), method) is not getattr(LLMAnalyzerInterface, method)
+
+    def get_lane_power_levels(self, game_data: GameData, levels: Iterable[int]) -> Dict[int, Tuple[Comparison, str]]:
+        """
+        Return get_lane_power_level for each of the given levels.
+        """
+        return _each(levels, lambda level: self.get_lane_power_level(game_data, level))
+
+    def get_lane_style_entries(self, game_data: GameData, dimensions: Iterable[LaningDimension]) -> Dict[LaningDimension, Tuple[Strength, Strength, str]]:
+        """
+        Return get_lane_style_entry for each of the given dimensions.
+        """
+        return _each(dimensions, lambda dimension: self.get_lane_style_entry(game_data, dimension))
+
+    def get_jungle_dimension_entries(self, game_data: GameData, dimensions: Iterable[JungleDimension]) -> Dict[JungleDimension, Tuple[Strength, Strength, str]]:
+        """
+        Return get_jungle_dimension_entry for each of the given dimensions.
+        """
+        return _each(dimensions, lambda dimension: self.get_jungle_dimension_entry(game_data, dimension))
+
     @abstractmethod
     def get_teamfight_threats(self, game_data: GameData) -> Dict[str, str]:
         """
@@ -56,4 +85,13 @@ class LLMAnalyzerInterface(ABC):
     def end_context_window(self) -> None:
         """
         Called after LLM input sequence completes. Used to flush, reset, or finalize any temporary state.
-        """
\ No newline at end of file
+        """
+
+def _each(items, fetch) -> dict:
+    results = {}
+    for item in items:
+        try:
+            results[item] = fetch(item)
+        except Exception:
+            continue
+    return results
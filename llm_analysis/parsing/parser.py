@@ -1,6 +1,9 @@
+import json
 import re
-from typing import Tuple, Dict, List
+from typing import Any, Iterable, Tuple, Dict, List, get_args
+from pydantic import TypeAdapter, ValidationError
 from core.models.literals import Comparison, Strength
+from core.models.matchup import LaneMatchupReport, JungleMatchupReport
 
 COMPARISON_VALUES: List[Comparison] = ["Weaker", "Even", "Stronger"]
 STRENGTH_VALUES: List[Strength] = ["Very Weak", "Weak", "Moderate", "Strong", "Very Strong"]
@@ -38,3 +41,38 @@ def parse_threat_output(text: str) -> Dict[str, str]:
 
 def parse_cooldown_tip(text: str) -> str:
     return text.strip()
+
+# Batched answers are validated item by item against the report models' own field types
+LEVEL_ENTRY = TypeAdapter(LaneMatchupReport.model_fields["level_1"].annotation)
+LANE_STYLE_ENTRY = TypeAdapter(get_args(LaneMatchupReport.model_fields["analysis"].annotation)[1])
+JUNGLE_ENTRY = TypeAdapter(get_args(JungleMatchupReport.model_fields["analysis"].annotation)[1])
+
+def parse_json_object(text: str) -> Dict[str, Any]:
+    """The JSON object in an LLM answer, tolerating code fences or prose around it."""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError(f"No JSON object in text: {text}")
+    try:
+        document = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in text: {e}") from e
+    if not isinstance(document, dict):
+        raise ValueError(f"Expected a JSON object, got: {text}")
+    return document
+
+def parse_batch_entries(text: str, keys: Iterable, adapter: TypeAdapter) -> Dict[Any, Any]:
+    """
+    Validate one entry per key from a batched JSON answer. Keys that are missing or whose
+    entry does not validate are left out so the caller can ask for them individually.
+    """
+    try:
+        document = parse_json_object(text)
+    except ValueError:
+        return {}
+    entries = {}
+    for key in keys:
+        try:
+            entries[key] = adapter.validate_python(document.get(str(key)))
+        except ValidationError:
+            continue
+    return entries
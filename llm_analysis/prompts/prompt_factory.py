@@ -1,14 +1,56 @@
-from core.models import GameData, LaningDimension, JungleDimension
+from typing import Iterable, get_args
+from core.models import GameData, PlayerGameEntry, LaningDimension, JungleDimension, Comparison, Strength
+from core.stat_curves import curves_for_table
+
+def _format_stats(stats: dict[str, float]) -> str:
+    return (
+        f"{stats['hp']:.0f} HP, {stats['ad']:.0f} AD, {stats['armor']:.0f} armor, "
+        f"{stats['mr']:.0f} MR, {stats['attack_speed']:.3f} attack speed"
+    )
+
+def _choices(literal) -> str:
+    return " | ".join(f'"{value}"' for value in get_args(literal))
+
+def _json_answer(keys: Iterable, entry: str) -> str:
+    keys = ", ".join(f'"{key}"' for key in keys)
+    return (
+        f"Answer with a single JSON object and nothing else. Use exactly these keys: {keys}. "
+        f"Each value must be a JSON array {entry}."
+    )
 
 class PromptFactory:
+    def _level_stats(self, entry: PlayerGameEntry, level: int) -> str:
+        return _format_stats(curves_for_table(entry.champion_table).at(entry.champion_id, level))
+
     def build_lane_power_prompt(self, game_data: GameData, level: int) -> str:
         user = game_data.get_user_entry()
         opponent = game_data.get_lane_opponent_entry()
         return (
             f"Compare power at level {level} between {user.champion.name} and {opponent.champion.name}. "
+            f"Base stats at level {level} (before items and runes): "
+            f"{user.champion.name} {self._level_stats(user, level)}; "
+            f"{opponent.champion.name} {self._level_stats(opponent, level)}. "
             f"Summarize who is stronger and why, considering base stats, abilities, runes, and power spikes."
         )
 
+    def build_lane_power_batch_prompt(self, game_data: GameData, levels: Iterable[int]) -> str:
+        user = game_data.get_user_entry()
+        opponent = game_data.get_lane_opponent_entry()
+        levels = list(levels)
+        stats = " ".join(
+            f"Level {level}: {user.champion.name} {self._level_stats(user, level)}; "
+            f"{opponent.champion.name} {self._level_stats(opponent, level)}."
+            for level in levels
+        )
+        return (
+            f"Compare power at each of levels {', '.join(map(str, levels))} between "
+            f"{user.champion.name} and {opponent.champion.name}. "
+            f"Base stats (before items and runes): {stats} "
+            f"For each level, say who is stronger and why, considering base stats, abilities, runes, and power spikes. "
+            + _json_answer(levels, f"[comparison, explanation] where comparison is one of {_choices(Comparison)} "
+                                   f"from {user.champion.name}'s point of view")
+        )
+
     def build_lane_style_prompt(self, game_data: GameData, dimension: LaningDimension) -> str:
         user = game_data.get_user_entry()
         opponent = game_data.get_lane_opponent_entry()
@@ -17,6 +59,17 @@ class PromptFactory:
             f"Rate their strength in this dimension and explain your reasoning."
         )
 
+    def build_lane_style_batch_prompt(self, game_data: GameData, dimensions: Iterable[LaningDimension]) -> str:
+        user = game_data.get_user_entry()
+        opponent = game_data.get_lane_opponent_entry()
+        dimensions = list(dimensions)
+        return (
+            f"Compare {user.champion.name} and {opponent.champion.name} in each of these laning dimensions: "
+            f"{', '.join(dimensions)}. Rate their strength in each dimension and explain your reasoning. "
+            + _json_answer(dimensions, f"[{user.champion.name} strength, {opponent.champion.name} strength, comment] "
+                                       f"where strengths are one of {_choices(Strength)}")
+        )
+
     def build_extra_spikes_prompt(self, game_data: GameData) -> str:
         user = game_data.get_user_entry()
         opponent = game_data.get_lane_opponent_entry()
@@ -33,6 +86,17 @@ class PromptFactory:
             f"Rate both sides and describe their comparative strengths."
         )
 
+    def build_jungle_batch_prompt(self, game_data: GameData, dimensions: Iterable[JungleDimension]) -> str:
+        ally_jungle = game_data.get_player("JUNGLE", "ALLY")
+        enemy_jungle = game_data.get_player("JUNGLE", "ENEMY")
+        dimensions = list(dimensions)
+        return (
+            f"Compare junglers {ally_jungle.champion.name} and {enemy_jungle.champion.name} in each of these "
+            f"dimensions: {', '.join(dimensions)}. Rate both sides and describe their comparative strengths. "
+            + _json_answer(dimensions, f"[{ally_jungle.champion.name} strength, {enemy_jungle.champion.name} strength, comment] "
+                                       f"where strengths are one of {_choices(Strength)}")
+        )
+
     def build_teamfight_prompt(self, game_data: GameData) -> str:
         return (
             "Evaluate each champion's potential impact in teamfights. "
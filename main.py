@@ -1,74 +1,82 @@
 import datetime
 from pathlib import Path
 
-from data_providers.riot_client import RiotAPIClient
-from data_providers.static_data import DataDragonClient
+from data_providers.game_data_assembler import GameDataAssembler
+from data_providers.live_watcher import LiveGameWatcher
+from data_providers._internal.config import DEFAULT_GAME_NAME, DEFAULT_TAG_LINE, CACHE_DIR, LLM_CACHE_MAX_BYTES
+from data_providers._internal.errors import NotFoundError
 from application.game_analyzer import GameInsightAnalyzer
 from presentation.html_renderer import HTMLReportRenderer
 from llm_analysis.mock_analyzer import MockLLMAnalyzer
-
-# Credentials and summoner info from `my user data.txt`
-RIOT_TOKEN = "RGAPI-e2126839-d146-4b52-a98d-13e483c1baca"
-GAME_NAME = "Cpt Szumi"
-TAG_LINE = "EUNE"
-REGION = "europe"
-SERVER = "euw1"
+from llm_analysis.cached_analyzer import CachedLLMAnalyzer, MatchupCache
+from core.models import GameData
 
 # Main orchestrator
 class InsightRunner:
     def __init__(self):
-        self.riot_client = RiotAPIClient(RIOT_TOKEN, REGION, SERVER)
-        self.static_provider = DataDragonClient()
-        self.analyzer = GameInsightAnalyzer(self.riot_client, self.static_provider, MockLLMAnalyzer())
+        self.assembler = GameDataAssembler()
+        cache = MatchupCache(CACHE_DIR / "matchups", max_bytes=LLM_CACHE_MAX_BYTES)
+        self.analyzer = GameInsightAnalyzer(CachedLLMAnalyzer(MockLLMAnalyzer(), cache))
         self.renderer = HTMLReportRenderer()
 
+    def close(self):
+        self.analyzer.close()
+
     def _generate_filename(self, summoner_name: str) -> Path:
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M")
         filename = self.renderer.get_output_filename(summoner_name, timestamp)
         return Path("reports") / filename
 
+    def _save_report(self, game_data: GameData) -> Path:
+        report = self.analyzer.generate_full_report(game_data)
+        for stage, error in report.errors.items():
+            print(f"⚠️ {stage} section missing: {error}")
+        output_path = self._generate_filename(report.summoner_name)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.renderer.render_html_report(report, output_path)
+        return output_path
+
     def run_live_game(self):
-        puuid = self.riot_client.get_puuid(GAME_NAME, TAG_LINE)
-        live_game = self.riot_client.get_live_game_info(puuid)
-        if not live_game:
+        try:
+            game_data = self.assembler.get_live_game_info(DEFAULT_GAME_NAME, DEFAULT_TAG_LINE)
+        except NotFoundError:
             print("🔁 Not currently in a live game.")
             return
-
-        report = self.analyzer.generate_full_report_from_live(live_game)
-        output_path = self._generate_filename(report.summoner_name)
-        self.renderer.render_html_report(report, output_path)
-        print(f"✅ Live game report saved to {output_path}")
+        print(f"✅ Live game report saved to {self._save_report(game_data)}")
 
     def run_last_game(self):
-        puuid = self.riot_client.get_puuid(GAME_NAME, TAG_LINE)
-        match_ids = self.riot_client.get_recent_match_ids(puuid, count=1)
+        match_ids = self.assembler.get_recent_game_ids(DEFAULT_GAME_NAME, DEFAULT_TAG_LINE, count=1)
         if not match_ids:
             print("⚠️ No recent matches found.")
             return
+        game_data = self.assembler.get_historical_game(match_ids[0], DEFAULT_GAME_NAME, DEFAULT_TAG_LINE)
+        print(f"✅ Last game report saved to {self._save_report(game_data)}")
 
-        match_data = self.riot_client.get_match_data(match_ids[0])
-        summary = self.riot_client.extract_match_participant_summary(match_data, puuid)
+    def run_watch(self, riot_ids: list[str], active_hours: list[int]):
+        accounts = {}
+        for riot_id in riot_ids:
+            game_name, _, tag_line = riot_id.partition("#")
+            accounts[self.assembler.riot.get_puuid(game_name, tag_line)] = game_name
 
-        lane = self.analyzer.analyze_lane_matchup(summary["user_champion"], summary["enemy_champion"])
-        jungle = self.analyzer.analyze_jungle_matchup(summary["ally_jungler"], summary["enemy_jungler"])
-        cooldowns = self.analyzer.get_cooldown_table(summary["user_champion"], summary["enemy_champion"])
-        threats = self.analyzer.analyze_threats({
-            "blue_team": summary["blue_team"],
-            "red_team": summary["red_team"],
-            "roles": summary["roles"]
-        })
+        def on_game_start(puuid: str, raw: dict):
+            game_name = accounts[puuid]
+            print(f"🎮 {game_name} started game {raw.get('gameId')}")
+            try:
+                output_path = self._save_report(self.assembler.map_live_game(raw, game_name))
+            except Exception as e:
+                print(f"⚠️ Report for {game_name} failed: {e}")
+                return
+            print(f"✅ Live game report saved to {output_path}")
 
-        from core.models import FullMatchReport
-        report = FullMatchReport(
-            summoner_name=summary["summoner_name"],
-            lane=lane,
-            jungle=jungle,
-            cooldowns=cooldowns,
-            threats=threats
-        )
-        output_path = self._generate_filename(report.summoner_name)
-        self.renderer.render_html_report(report, output_path)
-        print(f"✅ Last game report saved to {output_path}")
+        watcher = LiveGameWatcher(self.assembler.riot, on_game_start, active_hours=active_hours)
+        watcher.watch(accounts)
+        print(f"👀 Watching {len(accounts)} account(s), Ctrl+C to stop.")
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
 
 
 # ---- Entry Point ----
@@ -76,11 +84,19 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Run full game insight analysis.")
-    parser.add_argument("mode", choices=["live", "last"], help="Game mode to analyze")
+    parser.add_argument("mode", choices=["live", "last", "watch"], help="Game mode to analyze")
+    parser.add_argument("riot_ids", nargs="*", help="Riot IDs (name#tag) to watch; defaults to the configured account")
+    parser.add_argument("--active-hours", type=int, nargs="*", default=list(range(17, 24)),
+                        help="Local hours when watched players usually queue; polled more often")
     args = parser.parse_args()
 
     runner = InsightRunner()
-    if args.mode == "live":
-        runner.run_live_game()
-    else:
-        runner.run_last_game()
+    try:
+        if args.mode == "live":
+            runner.run_live_game()
+        elif args.mode == "watch":
+            runner.run_watch(args.riot_ids or [f"{DEFAULT_GAME_NAME}#{DEFAULT_TAG_LINE}"], args.active_hours)
+        else:
+            runner.run_last_game()
+    finally:
+        runner.close()
@@ -1,4 +1,5 @@
 import pytest
+import time
 from application.game_analyzer import GameInsightAnalyzer
 from core.models import (
     GameData,
@@ -134,3 +135,184 @@ def test_analyze_cooldowns(minimal_game_data):
     assert isinstance(result.allyQ, dict)
     assert isinstance(result.enemyQ, dict)
     assert isinstance(result.cooldown_leverage_comment, str)
+
+class SlowFlakyLLMAnalyzer(DummyLLMAnalyzer):
+    """Every call sleeps; level 3 and the Roaming dimension always fail."""
+    def __init__(self, delay=0.05):
+        self.delay = delay
+
+    def get_lane_power_level(self, game_data, level):
+        time.sleep(self.delay)
+        if level == 3:
+            raise RuntimeError("timeout")
+        return super().get_lane_power_level(game_data, level)
+
+    def get_lane_style_entry(self, game_data, dimension):
+        time.sleep(self.delay)
+        if dimension == "Roaming":
+            raise RuntimeError("bad output")
+        return super().get_lane_style_entry(game_data, dimension)
+
+def test_analyze_lane_matchup_runs_calls_concurrently(minimal_game_data):
+    analyzer = GameInsightAnalyzer(llm=SlowFlakyLLMAnalyzer(), max_concurrency=16)
+    started = time.perf_counter()
+    result = analyzer.analyze_lane_matchup(minimal_game_data)
+    # 15 calls of 50 ms each would take 750 ms back to back
+    assert time.perf_counter() - started < 0.4
+    assert result.level_2 == ("Even", "Level 2 comparison")
+    assert result.level_3[0] == "Even"
+    assert "Roaming" not in result.analysis
+    assert list(result.analysis) == [d for d in LaningDimension.__args__ if d != "Roaming"]
+    assert result.extra_comments == ["level_3 analysis failed: timeout", "Roaming analysis failed: bad output"]
+
+def test_analyze_lane_matchup_serial_when_concurrency_is_one(minimal_game_data):
+    result = GameInsightAnalyzer(llm=SlowFlakyLLMAnalyzer(delay=0), max_concurrency=1).analyze_lane_matchup(minimal_game_data)
+    assert len(result.extra_comments) == 2
+
+def test_stage_pipeline_runs_independent_stages_in_parallel():
+    from application.pipeline import Stage, StagePipeline
+
+    def slow(value):
+        def run(inputs):
+            time.sleep(0.1)
+            return value + sum(inputs.values())
+        return run
+
+    def broken(inputs):
+        raise RuntimeError("LLM down")
+
+    pipeline = StagePipeline([
+        Stage("a", slow(1)),
+        Stage("b", slow(2)),
+        Stage("c", slow(3)),
+        Stage("sum", slow(0), deps=["a", "b"]),
+        Stage("broken", broken),
+        Stage("after_broken", slow(0), deps=["broken"]),
+        Stage("after_after", slow(0), deps=["after_broken", "a"]),
+    ])
+    started = time.perf_counter()
+    result = pipeline.run()
+    assert time.perf_counter() - started < 0.35
+    assert result.results == {"a": 1, "b": 2, "c": 3, "sum": 3}
+    assert result.errors == {
+        "broken": "RuntimeError: LLM down",
+        "after_broken": "skipped: broken failed",
+        "after_after": "skipped: after_broken failed",
+    }
+    assert set(result.timings) == {"a", "b", "c", "sum", "broken"}
+
+def test_stage_pipeline_rejects_cycles():
+    from application.pipeline import Stage, StagePipeline
+    with pytest.raises(ValueError):
+        StagePipeline([Stage("a", lambda _: 1, deps=["b"]), Stage("b", lambda _: 2, deps=["a"])])
+    with pytest.raises(ValueError):
+        StagePipeline([Stage("a", lambda _: 1, deps=["missing"])])
+
+def test_generate_full_report_keeps_sections_that_succeed(minimal_game_data):
+    class NoCooldownsLLM(DummyLLMAnalyzer):
+        def get_cooldowns_leverage_suggestion(self, game_data):
+            raise RuntimeError("rate limited")
+
+    report = GameInsightAnalyzer(llm=NoCooldownsLLM()).generate_full_report(minimal_game_data)
+    assert report.summoner_name == "Cpt Szumi"
+    assert isinstance(report.lane, LaneMatchupReport)
+    assert isinstance(report.jungle, JungleMatchupReport)
+    assert isinstance(report.threats, ThreatProjectionReport)
+    assert report.cooldowns is None
+    assert report.errors == {"cooldowns": "RuntimeError: rate limited"}
+    assert {"lane", "jungle", "threats", "cooldowns", "total"} <= set(report.stage_timings)
+
+class BatchingLLMAnalyzer(DummyLLMAnalyzer):
+    """Answers whole batches in one call; drops level 4 and fails the jungle batch outright."""
+    def __init__(self):
+        self.calls = []
+
+    def get_lane_power_level(self, game_data, level):
+        self.calls.append(f"level_{level}")
+        return super().get_lane_power_level(game_data, level)
+
+    def get_jungle_dimension_entry(self, game_data, dimension):
+        self.calls.append(dimension)
+        return super().get_jungle_dimension_entry(game_data, dimension)
+
+    def get_lane_power_levels(self, game_data, levels):
+        self.calls.append("levels")
+        return {level: DummyLLMAnalyzer.get_lane_power_level(self, game_data, level) for level in levels if level != 4}
+
+    def get_lane_style_entries(self, game_data, dimensions):
+        self.calls.append("styles")
+        return {dimension: self.get_lane_style_entry(game_data, dimension) for dimension in dimensions}
+
+    def get_jungle_dimension_entries(self, game_data, dimensions):
+        self.calls.append("jungle")
+        raise RuntimeError("invalid JSON")
+
+def test_analyzer_prefers_batch_methods_and_refills_missing_items(minimal_game_data):
+    llm = BatchingLLMAnalyzer()
+    analyzer = GameInsightAnalyzer(llm=llm)
+    lane = analyzer.analyze_lane_matchup(minimal_game_data)
+    assert lane.level_2 == ("Even", "Level 2 comparison")
+    assert lane.level_4 == ("Even", "Level 4 comparison")
+    assert list(lane.analysis) == list(LaningDimension.__args__)
+    assert lane.extra_comments == []
+    jungle = analyzer.analyze_jungle_matchup(minimal_game_data)
+    assert list(jungle.analysis) == list(JungleDimension.__args__)
+    assert sorted(llm.calls) == sorted(["levels", "styles", "level_4", "jungle", *JungleDimension.__args__])
+
+def test_analyzer_fans_out_interface_analyzers_without_real_batching(minimal_game_data):
+    from llm_analysis.mock_analyzer import MockLLMAnalyzer
+
+    class SlowMock(MockLLMAnalyzer):
+        def get_lane_power_level(self, game_data, level):
+            time.sleep(0.1)
+            return super().get_lane_power_level(game_data, level)
+
+        def get_lane_style_entry(self, game_data, dimension):
+            time.sleep(0.1)
+            return super().get_lane_style_entry(game_data, dimension)
+
+    assert not SlowMock().batches("get_lane_power_levels")
+    started = time.perf_counter()
+    result = GameInsightAnalyzer(llm=SlowMock(), max_concurrency=16).analyze_lane_matchup(minimal_game_data)
+    # 15 calls of 100 ms each would take 1.5 s one by one
+    assert time.perf_counter() - started < 0.5
+    assert len(result.analysis) == len(LaningDimension.__args__)
+
+def test_analyzer_refills_a_bad_batch_concurrently(minimal_game_data):
+    from llm_analysis.mock_analyzer import MockLLMAnalyzer
+
+    class BadJsonLLM(MockLLMAnalyzer):
+        def get_lane_power_levels(self, game_data, levels):
+            return {}
+
+        def get_lane_power_level(self, game_data, level):
+            time.sleep(0.1)
+            return super().get_lane_power_level(game_data, level)
+
+    assert BadJsonLLM().batches("get_lane_power_levels")
+    started = time.perf_counter()
+    result = GameInsightAnalyzer(llm=BadJsonLLM(), max_concurrency=8).analyze_lane_matchup(minimal_game_data)
+    assert time.perf_counter() - started < 0.4
+    assert result.level_6 == MockLLMAnalyzer().get_lane_power_level(minimal_game_data, 6)
+
+def test_failed_threat_side_is_reported(minimal_game_data):
+    class NoSidelaneLLM(DummyLLMAnalyzer):
+        def get_sidelane_threats(self, game_data):
+            raise RuntimeError("bad output")
+
+    class NoThreatsLLM(NoSidelaneLLM):
+        def get_teamfight_threats(self, game_data):
+            raise RuntimeError("bad output")
+
+    with GameInsightAnalyzer(llm=NoSidelaneLLM()) as analyzer:
+        threats = analyzer.analyze_threats(minimal_game_data)
+        assert threats.sidelane_threats == {} and "Aatrox" in threats.teamfight_threats
+        assert threats.errors == {"sidelane": "RuntimeError: bad output"}
+        report = analyzer.generate_full_report(minimal_game_data)
+        assert report.errors == {"threats.sidelane": "RuntimeError: bad output"}
+    assert analyzer._pool._shutdown
+
+    with GameInsightAnalyzer(llm=NoThreatsLLM()) as analyzer:
+        report = analyzer.generate_full_report(minimal_game_data)
+    assert report.threats is None
+    assert report.errors == {"threats": "RuntimeError: bad output"}
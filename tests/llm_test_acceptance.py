@@ -123,3 +123,123 @@ def test_cooldown_suggestion(analyzer, game_data):
 def test_context_lifecycle(analyzer):
     analyzer.start_context_window()
     analyzer.end_context_window()
+
+def test_lane_power_prompt_includes_level_stats(game_data):
+    from llm_analysis.prompts.prompt_factory import PromptFactory
+    prompt = PromptFactory().build_lane_power_prompt(game_data, 18)
+    # 600 + 90 * 17 * (0.7025 + 0.0175 * 17) = 2129.5
+    assert "Aatrox 2130 HP, 145 AD" in prompt
+
+def test_batch_methods_default_to_per_item_calls(analyzer, game_data):
+    levels = analyzer.get_lane_power_levels(game_data, range(1, 7))
+    assert list(levels) == [1, 2, 3, 4, 5, 6]
+    styles = analyzer.get_lane_style_entries(game_data, LaningDimension.__args__)
+    assert list(styles) == list(LaningDimension.__args__)
+    jungle = analyzer.get_jungle_dimension_entries(game_data, JungleDimension.__args__)
+    assert list(jungle) == list(JungleDimension.__args__)
+
+def test_parse_batch_entries_keeps_only_valid_items():
+    from llm_analysis.parsing.parser import parse_batch_entries, LEVEL_ENTRY, LANE_STYLE_ENTRY
+    text = '''```json
+    {"1": ["Stronger", "Q range"], "2": ["Much stronger", "?"], "3": ["Even"], "5": ["Weaker", "E up"]}
+    ```'''
+    assert parse_batch_entries(text, range(1, 7), LEVEL_ENTRY) == {1: ("Stronger", "Q range"), 5: ("Weaker", "E up")}
+    text = '{"Sustain": ["Strong", "Weak", "Heals"], "Roaming": ["Weak", "Mid", "no"]}'
+    assert parse_batch_entries(text, ["Sustain", "Roaming"], LANE_STYLE_ENTRY) == {"Sustain": ("Strong", "Weak", "Heals")}
+    assert parse_batch_entries("I can't answer that", ["Sustain"], LANE_STYLE_ENTRY) == {}
+
+def test_batch_prompts_ask_for_every_key(game_data):
+    from llm_analysis.prompts.prompt_factory import PromptFactory
+    prompt = PromptFactory().build_lane_power_batch_prompt(game_data, range(1, 7))
+    assert '"1", "2", "3", "4", "5", "6"' in prompt
+    assert "Aatrox 2130 HP" not in prompt and "Level 6: Aatrox" in prompt
+    prompt = PromptFactory().build_lane_style_batch_prompt(game_data, LaningDimension.__args__)
+    assert all(f'"{dimension}"' in prompt for dimension in LaningDimension.__args__)
+
+def test_gpt_batch_returns_only_valid_items(game_data):
+    from llm_analysis.gpt_analyzer import GPTLLMAnalyzer
+    from llm_analysis.prompts.prompt_factory import PromptFactory
+
+    class ScriptedClient:
+        def __init__(self):
+            self.prompts = []
+
+        def call(self, prompt):
+            self.prompts.append(prompt)
+            return '{"1": ["Stronger", "Q range"], "2": ["Even", "Trades"], "3": ["Clearly", "?"]}'
+
+    analyzer = GPTLLMAnalyzer.__new__(GPTLLMAnalyzer)
+    analyzer.prompter, analyzer.llm = PromptFactory(), ScriptedClient()
+    assert analyzer.batches("get_lane_power_levels")
+    levels = analyzer.get_lane_power_levels(game_data, range(1, 5))
+    # Invalid level 3 and missing level 4 are left for the caller to fan out item by item
+    assert levels == {1: ("Stronger", "Q range"), 2: ("Even", "Trades")}
+    assert len(analyzer.llm.prompts) == 1
+
+class CountingAnalyzer(MockLLMAnalyzer):
+    def __init__(self):
+        self.calls = []
+
+    def get_lane_power_level(self, game_data, level):
+        self.calls.append(f"level_{level}")
+        return super().get_lane_power_level(game_data, level)
+
+    def get_lane_extra_spikes(self, game_data):
+        self.calls.append("spikes")
+        return super().get_lane_extra_spikes(game_data)
+
+def test_cached_analyzer_reuses_results_per_matchup_and_patch(tmp_path, game_data):
+    from llm_analysis.cached_analyzer import CachedLLMAnalyzer, MatchupCache
+    inner = CountingAnalyzer()
+    patch_14 = game_data.model_copy(update={"patch_version": "14.10.1"})
+    cached = CachedLLMAnalyzer(inner, MatchupCache(tmp_path))
+    first = cached.get_lane_power_levels(patch_14, range(1, 4))
+    assert cached.get_lane_extra_spikes(patch_14)[9] == ("Stronger", "Mock spike at 9")
+
+    # A fresh process sees the same files; only level 4 is new
+    cached = CachedLLMAnalyzer(inner, MatchupCache(tmp_path))
+    assert cached.get_lane_power_levels(patch_14, range(1, 5)) == {**first, 4: inner.get_lane_power_level(patch_14, 4)}
+    assert cached.get_lane_extra_spikes(patch_14) == inner.get_lane_extra_spikes(patch_14)
+    assert inner.calls == ["level_1", "level_2", "level_3", "spikes", "level_4", "level_4", "spikes"]
+
+    inner.calls.clear()
+    cached.get_lane_power_level(game_data.model_copy(update={"patch_version": "14.11.1"}), 1)
+    assert inner.calls == ["level_1"]
+
+def test_matchup_cache_evicts_other_patches_then_least_recently_used(tmp_path):
+    from llm_analysis.cached_analyzer import MatchupCache, matchup_key
+    now = [1000.0]
+    cache = MatchupCache(tmp_path, max_bytes=10_000, low_water=0.7, clock=lambda: now[0])
+    old = matchup_key("Aatrox", "Darius", "top", "14.10.1")
+    assert old == matchup_key(" aatrox", "DARIUS", "TOP", "14.10.1")
+    cache.set(old, "tip", "x" * 3000)
+    new = matchup_key("Aatrox", "Darius", "TOP", "14.11.1")
+    for i in range(2):
+        now[0] += 10
+        cache.set(new, f"tip{i}", "x" * 3000)
+    now[0] += 10
+    assert cache.get(new, "tip0") is not None  # now the most recently used
+    # Going over 10 kB evicts the other patch, then the least recently used, down to 7 kB
+    cache.set(new, "tip2", "x" * 3000)
+    assert cache.get(old, "tip") is None
+    assert cache.get(new, "tip1") is None
+    assert cache.get(new, "tip0") is not None and cache.get(new, "tip2") is not None
+
+    # Overwrites replace their old size instead of adding to it
+    for _ in range(10):
+        cache.set(new, "tip2", "x" * 3000)
+    assert cache._size == sum(f.stat().st_size for f in tmp_path.rglob("*.json"))
+    assert cache.get(new, "tip0") is not None
+
+    with pytest.raises(ValueError):
+        cache.set(matchup_key("Aatrox", "Darius", "TOP", ""), "tip", "x")
+
+def test_cached_analyzer_skips_the_cache_without_a_patch(tmp_path, game_data):
+    from llm_analysis.cached_analyzer import CachedLLMAnalyzer, MatchupCache
+    inner = CountingAnalyzer()
+    cached = CachedLLMAnalyzer(inner, MatchupCache(tmp_path))
+    assert game_data.patch_version == "" and game_data.get_user_entry().patch == ""
+    cached.get_lane_power_level(game_data, 1)
+    cached.get_lane_power_level(game_data, 1)
+    assert inner.calls == ["level_1", "level_1"]
+    assert not list(tmp_path.rglob("*.json"))